@@ -1,3 +1,4 @@
+import logging
 import os
 import sys
 # DON'T CHANGE THIS !!!
@@ -9,6 +10,9 @@ from src.models.user import db
 from src.routes.user import user_bp
 from src.routes.analyze import analyze_bp
 
+# Configure logging once for the whole application; modules only create their loggers
+logging.basicConfig(level=logging.INFO)
+
 app = Flask(__name__, static_folder=os.path.join(os.path.dirname(__file__), 'static'))
 
 # Use environment variable for secret key or fallback to default
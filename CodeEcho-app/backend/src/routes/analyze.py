@@ -2,66 +2,224 @@
 API routes for website analysis and prompt generation.
 """
 import asyncio
-import json
+import copy
+import hashlib
+import io
 import os
+import time
 import uuid
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from functools import wraps
 from flask import Blueprint, request, jsonify, send_file
+from flask.json.provider import DefaultJSONProvider
 from werkzeug.exceptions import BadRequest
-import tempfile
 import zipfile
 import logging
 
 from src.services.scraper import scrape_website_sync
 from src.services.analyzer import WebsiteAnalyzer
 from src.services.prompt_generator import PromptGenerator
+from src.services.session_cache import SessionCache
+from src.utils import fastjson
 
-logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 analyze_bp = Blueprint('analyze', __name__)
 
-# Store analysis results temporarily (in production, use a database)
-analysis_cache = {}
+class FastJSONProvider(DefaultJSONProvider):
+    """Flask JSON provider backed by the fastest available serializer (orjson/ujson/json)."""
+    
+    def dumps(self, obj, **kwargs):
+        # Keep the default provider's key ordering (sort_keys) and debug indentation
+        sort_keys = kwargs.get('sort_keys', self.sort_keys)
+        indent = bool(kwargs.get('indent'))
+        return fastjson.dumps(obj, indent=indent, sort_keys=sort_keys, default=self.default).decode('utf-8')
+    
+    def loads(self, s, **kwargs):
+        return fastjson.loads(s)
 
-@analyze_bp.route('/analyze-website', methods=['POST'])
-def analyze_website():
+
+@analyze_bp.record_once
+def _use_fast_json_provider(state):
+    """Switch the application to the fast JSON provider when the blueprint is registered."""
+    state.app.json = FastJSONProvider(state.app)
+
+class AnalyzeError(Exception):
+    """Base error for the analysis API, carrying the HTTP status and error_type to report."""
+    
+    http_status = 500
+    error_type = 'internal_error'
+    
+    def __init__(self, message, http_status=None, error_type=None):
+        super().__init__(message)
+        self.message = message
+        if http_status is not None:
+            self.http_status = http_status
+        if error_type is not None:
+            self.error_type = error_type
+
+class ScrapingError(AnalyzeError):
+    error_type = 'scraping_error'
+
+class AnalysisError(AnalyzeError):
+    error_type = 'analysis_error'
+
+class PromptError(AnalyzeError):
+    error_type = 'prompt_generation_error'
+
+class SessionNotFound(AnalyzeError):
+    http_status = 404
+    error_type = 'session_not_found'
+
+class SessionNotReady(AnalyzeError):
+    http_status = 409
+    error_type = 'session_not_ready'
+
+def _error_response(message, error_type, http_status):
+    return jsonify(status='error', message=message, error_type=error_type), http_status
+
+def handle_errors(message='An unexpected error occurred', error_type='internal_error'):
     """
-    Analyze a website and generate prompts for recreation.
+    Turn exceptions raised by a route into the API's JSON error responses.
     
-    Expected JSON payload:
-    {
-        "url": "https://example.com"
-    }
+    BadRequest maps to a 400 validation_error, AnalyzeError subclasses to
+    their own status and error_type, and anything else is logged and reported
+    as a 500 with the given fallback message and error_type.
+    """
+    def decorator(fn):
+        @wraps(fn)
+        def wrapper(*args, **kwargs):
+            try:
+                return fn(*args, **kwargs)
+            except BadRequest as e:
+                return _error_response(str(e), 'validation_error', 400)
+            except AnalyzeError as e:
+                return _error_response(e.message, e.error_type, e.http_status)
+            except Exception:
+                logger.exception(f"Unexpected error in {fn.__name__}")
+                return _error_response(message, error_type, 500)
+        return wrapper
+    return decorator
+
+# Store analysis results temporarily (in production, use a database).
+# Bounded LRU with TTL so abandoned sessions don't accumulate forever.
+session_cache = SessionCache(
+    max_entries=int(os.environ.get('SESSION_CACHE_SIZE', 1024)),
+    ttl=float(os.environ.get('SESSION_CACHE_TTL', 3600))
+)
+
+# Finished (analysis_result, prompt_result) pairs keyed by a hash of the scraped
+# content, so an identical scrape skips analysis and prompt generation
+result_cache = SessionCache(
+    max_entries=int(os.environ.get('RESULT_CACHE_SIZE', 1024)),
+    ttl=float(os.environ.get('RESULT_CACHE_TTL', 3600))
+)
+
+# Background workers for the scrape -> analyze -> generate pipeline
+pipeline_executor = ThreadPoolExecutor(max_workers=int(os.environ.get('ANALYSIS_WORKERS', 4)))
+
+def _url_cache_key(url):
+    """Content key for a URL: blake2b hash of its normalized form."""
+    normalized = url.lower().rstrip('/')
+    return hashlib.blake2b(normalized.encode('utf-8'), digest_size=16).hexdigest()
+
+def _content_cache_key(scraped_data):
+    """Content key for a scrape: blake2b hash of its payload, ignoring the scrape timestamp."""
+    payload = {k: v for k, v in scraped_data.items() if k != 'timestamp'}
+    return hashlib.blake2b(fastjson.dumps(payload, sort_keys=True, default=str), digest_size=16).hexdigest()
+
+def _alias_cached_analysis(url):
+    """
+    Reuse a finished analysis of the same URL if one is still cached.
+    
+    The stored entry is copied under a fresh session ID so /session and
+    /download keep working per caller; the ZIP is rebuilt for the alias since
+    its metadata embeds the session ID. Aliases carry the original
+    analyzed_at, so a URL is re-scraped once its analysis is older than the
+    cache TTL however often it is requested.
     
     Returns:
-    {
-        "session_id": "unique_session_id",
-        "status": "success",
-        "analysis": {...},
-        "prompts": {...}
+        tuple: (session_id, entry), or (None, None) on a miss
+    """
+    url_key = _url_cache_key(url)
+    existing_sid = session_cache.lookup_url(url_key)
+    if not existing_sid:
+        return None, None
+    
+    entry = session_cache.get(existing_sid)
+    if not entry or entry.get('status') != 'done':
+        return None, None
+    if time.monotonic() - entry.get('analyzed_at', 0.0) > session_cache.ttl:
+        return None, None
+    
+    session_id = str(uuid.uuid4())
+    alias = {k: v for k, v in entry.items() if k != 'zip_bytes'}
+    session_cache.put(session_id, alias, cost=entry.get('cost', 0.0))
+    session_cache.index_url(url_key, session_id)
+    logger.info(f"Reusing cached analysis of {url} from session {existing_sid} as {session_id}")
+    return session_id, alias
+
+# Prompt sections summarized by length in the /analyze-website response
+REQUIREMENT_SECTIONS = ('design', 'functionality', 'technical', 'content', 'user_experience')
+
+def _build_response_views(analysis_result, prompt_result):
+    """
+    Build the summary views returned by /analyze-website.
+    
+    These are pure functions of the pipeline output, so they are computed once
+    when the pipeline finishes and stored on the session entry.
+    
+    Returns:
+        tuple: (analysis_view, response_view)
+    """
+    website_info = analysis_result.get('website_info', {})
+    functionality = analysis_result.get('functionality_analysis', {})
+    business_model = analysis_result.get('business_model', {})
+    analysis_view = {
+        'website_info': website_info,
+        'design_analysis': analysis_result.get('design_analysis', {}),
+        'functionality_analysis': functionality,
+        'technical_analysis': analysis_result.get('technical_analysis', {}),
+        'summary': {
+            'website_type': website_info.get('website_type', ''),
+            'primary_purpose': website_info.get('primary_purpose', ''),
+            'business_type': business_model.get('business_type', ''),
+            'core_features': functionality.get('core_features', [])
+        }
+    }
+    
+    text_format = prompt_result.get('text_format', '')
+    sections = prompt_result.get('sections', {})
+    response_view = {
+        'text_preview': text_format[:1000] + '...' if len(text_format) > 1000 else text_format,
+        'json_preview': {
+            'project_overview': prompt_result.get('json_format', {}).get('project_overview', {}),
+            'requirements_summary': {key: len(sections.get(key, '')) for key in REQUIREMENT_SECTIONS}
+        },
+        'metadata': prompt_result.get('metadata', {})
     }
+    
+    return analysis_view, response_view
+
+def _run_pipeline(session_id, url):
     """
-    try:
-        # Validate request
-        if not request.is_json:
-            raise BadRequest("Request must be JSON")
-        
-        data = request.get_json()
-        url = data.get('url')
-        
-        if not url:
-            raise BadRequest("URL is required")
-        
-        # Validate URL format
-        if not url.startswith(('http://', 'https://')):
-            url = 'https://' + url
-        
-        logger.info(f"Starting analysis for URL: {url}")
-        
-        # Generate session ID
-        session_id = str(uuid.uuid4())
+    Scrape, analyze and generate prompts for a URL, recording progress in the session cache.
+    
+    The session entry moves from 'running' to either 'done' or 'error'; each
+    transition replaces the whole entry so readers never see a partial result.
+    
+    Args:
+        session_id: The session ID to store results under
+        url: The normalized URL to analyze
         
+    Returns:
+        dict: The final session entry
+    """
+    timestamp = datetime.now().isoformat()
+    session_cache.put(session_id, {'url': url, 'timestamp': timestamp, 'status': 'running'})
+    
+    try:
         # Step 1: Scrape the website with retry logic
         logger.info("Step 1: Scraping website...")
         scraped_data = None
@@ -79,167 +237,177 @@ def analyze_website():
             except Exception as e:
                 logger.error(f"Scraping attempt {attempt + 1} failed: {str(e)}")
                 if attempt == max_retries - 1:
-                    return jsonify({
-                        'status': 'error',
-                        'message': f'Failed to scrape website after {max_retries} attempts: {str(e)}',
-                        'error_type': 'scraping_error'
-                    }), 500
+                    raise ScrapingError(f'Failed to scrape website after {max_retries} attempts: {str(e)}')
         
         if not scraped_data:
-            return jsonify({
-                'status': 'error',
-                'message': 'Failed to scrape website - no data returned',
-                'error_type': 'scraping_error'
-            }), 500
-        
-        # Step 2: Analyze the scraped data
-        logger.info("Step 2: Analyzing scraped data...")
-        try:
-            analyzer = WebsiteAnalyzer()
-            analysis_result = analyzer.analyze_scraped_data(scraped_data)
-        except Exception as e:
-            logger.error(f"Analysis failed: {str(e)}")
-            return jsonify({
-                'status': 'error',
-                'message': f'Failed to analyze website: {str(e)}',
-                'error_type': 'analysis_error'
-            }), 500
+            raise ScrapingError('Failed to scrape website - no data returned')
         
-        # Step 3: Generate prompts
-        logger.info("Step 3: Generating prompts...")
-        try:
-            prompt_generator = PromptGenerator()
-            prompt_result = prompt_generator.generate_comprehensive_prompt(analysis_result)
-        except Exception as e:
-            logger.error(f"Prompt generation failed: {str(e)}")
-            return jsonify({
-                'status': 'error',
-                'message': f'Failed to generate prompts: {str(e)}',
-                'error_type': 'prompt_generation_error'
-            }), 500
+        # Identical content (e.g. concurrent requests for one page) reuses the finished results
+        content_key = _content_cache_key(scraped_data)
+        cached = result_cache.get(content_key)
+        if cached is not None:
+            logger.info("Reusing analysis and prompts of identical content for %s", url)
+            # Each session gets its own copy so sessions never share result objects
+            analysis_result, prompt_result = copy.deepcopy(cached)
+        else:
+            # Step 2: Analyze the scraped data
+            logger.info("Step 2: Analyzing scraped data...")
+            try:
+                analyzer = WebsiteAnalyzer()
+                analysis_result = analyzer.analyze_scraped_data(scraped_data)
+            except Exception as e:
+                logger.error(f"Analysis failed: {str(e)}")
+                raise AnalysisError(f'Failed to analyze website: {str(e)}')
+            
+            # Step 3: Generate prompts
+            logger.info("Step 3: Generating prompts...")
+            try:
+                prompt_generator = PromptGenerator()
+                prompt_result = prompt_generator.generate_comprehensive_prompt(analysis_result)
+            except Exception as e:
+                logger.error(f"Prompt generation failed: {str(e)}")
+                raise PromptError(f'Failed to generate prompts: {str(e)}')
         
         # Store results in cache
-        analysis_cache[session_id] = {
+        entry = {
             'url': url,
-            'timestamp': datetime.now().isoformat(),
+            'timestamp': timestamp,
+            'status': 'done',
+            'analyzed_at': time.monotonic(),
             'scraped_data': scraped_data,
             'analysis_result': analysis_result,
             'prompt_result': prompt_result
         }
+        entry['analysis_view'], entry['response_view'] = _build_response_views(analysis_result, prompt_result)
         
-        logger.info(f"Analysis completed successfully for session: {session_id}")
+        # Size of the generated output approximates how costly the session would be to regenerate
+        entry['cost'] = len(prompt_result.get('text_format', '')) + len(fastjson.dumps(analysis_result))
+        session_cache.put(session_id, entry, cost=entry['cost'])
+        session_cache.index_url(_url_cache_key(url), session_id)
+        result_cache.put(content_key, copy.deepcopy((analysis_result, prompt_result)), cost=entry['cost'])
         
-        # Return response
+        logger.info(f"Analysis completed successfully for session: {session_id}")
+        return entry
+    
+    except AnalyzeError as e:
+        error = e
+    except Exception as e:
+        logger.error(f"Unexpected error in analysis pipeline: {str(e)}")
+        error = AnalyzeError('An unexpected error occurred during analysis')
+    
+    entry = {
+        'url': url,
+        'timestamp': timestamp,
+        'status': 'error',
+        'message': error.message,
+        'error_type': error.error_type
+    }
+    session_cache.put(session_id, entry)
+    return entry
+
+@analyze_bp.route('/analyze-website', methods=['POST'])
+@handle_errors('An unexpected error occurred during analysis')
+def analyze_website():
+    """
+    Analyze a website and generate prompts for recreation.
+    
+    Expected JSON payload:
+    {
+        "url": "https://example.com",
+        "async": false
+    }
+    
+    Returns:
+    {
+        "session_id": "unique_session_id",
+        "status": "success",
+        "analysis": {...},
+        "prompts": {...}
+    }
+    
+    With "async": true the pipeline runs in a background worker and the
+    response is 202 {"session_id": ..., "status": "pending"}; poll
+    /session/<session_id> until the status is no longer pending/running.
+    """
+    # Validate request
+    if not request.is_json:
+        raise BadRequest("Request must be JSON")
+    
+    data = request.get_json()
+    url = data.get('url')
+    
+    if not url:
+        raise BadRequest("URL is required")
+    
+    # Validate URL format
+    if not url.startswith(('http://', 'https://')):
+        url = 'https://' + url
+    
+    # Serve repeated URLs from the cache instead of re-running the pipeline
+    session_id, entry = _alias_cached_analysis(url)
+    if entry is not None:
         return jsonify({
             'session_id': session_id,
             'status': 'success',
-            'analysis': {
-                'website_info': analysis_result.get('website_info', {}),
-                'design_analysis': analysis_result.get('design_analysis', {}),
-                'functionality_analysis': analysis_result.get('functionality_analysis', {}),
-                'technical_analysis': analysis_result.get('technical_analysis', {}),
-                'summary': {
-                    'website_type': analysis_result.get('website_info', {}).get('website_type', ''),
-                    'primary_purpose': analysis_result.get('website_info', {}).get('primary_purpose', ''),
-                    'business_type': analysis_result.get('business_model', {}).get('business_type', ''),
-                    'core_features': analysis_result.get('functionality_analysis', {}).get('core_features', [])
-                }
-            },
-            'prompts': {
-                'text_preview': prompt_result.get('text_format', '')[:1000] + '...' if len(prompt_result.get('text_format', '')) > 1000 else prompt_result.get('text_format', ''),
-                'json_preview': {
-                    'project_overview': prompt_result.get('json_format', {}).get('project_overview', {}),
-                    'requirements_summary': {
-                        'design': len(prompt_result.get('sections', {}).get('design', '')),
-                        'functionality': len(prompt_result.get('sections', {}).get('functionality', '')),
-                        'technical': len(prompt_result.get('sections', {}).get('technical', '')),
-                        'content': len(prompt_result.get('sections', {}).get('content', '')),
-                        'user_experience': len(prompt_result.get('sections', {}).get('user_experience', ''))
-                    }
-                },
-                'metadata': prompt_result.get('metadata', {})
-            }
+            'analysis': entry['analysis_view'],
+            'prompts': entry['response_view']
         })
-        
-    except BadRequest as e:
-        return jsonify({
-            'status': 'error',
-            'message': str(e),
-            'error_type': 'validation_error'
-        }), 400
-    except Exception as e:
-        logger.error(f"Unexpected error in analyze_website: {str(e)}")
+    
+    logger.info(f"Starting analysis for URL: {url}")
+    
+    # Generate session ID
+    session_id = str(uuid.uuid4())
+    
+    if data.get('async'):
+        session_cache.put(session_id, {
+            'url': url,
+            'timestamp': datetime.now().isoformat(),
+            'status': 'pending'
+        })
+        pipeline_executor.submit(_run_pipeline, session_id, url)
         return jsonify({
-            'status': 'error',
-            'message': 'An unexpected error occurred during analysis',
-            'error_type': 'internal_error'
-        }), 500
-
-@analyze_bp.route('/download/<session_id>', methods=['GET'])
-def download_results(session_id):
-    """
-    Download analysis results as a zip file.
+            'session_id': session_id,
+            'status': 'pending'
+        }), 202
     
-    Args:
-        session_id: The session ID from the analysis
+    entry = _run_pipeline(session_id, url)
+    if entry['status'] == 'error':
+        raise AnalyzeError(entry['message'], error_type=entry['error_type'])
+    
+    # Return response
+    return jsonify({
+        'session_id': session_id,
+        'status': 'success',
+        'analysis': entry['analysis_view'],
+        'prompts': entry['response_view']
+    })
+
+def _build_download_package(session_id, session_data):
+    """Build the ZIP package for a session and return its bytes."""
+    # Build the ZIP package in memory; no temporary files are written
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, 'w', zipfile.ZIP_DEFLATED, compresslevel=6) as zipf:
+        # 1. Text prompt file
+        zipf.writestr('prompt.txt', session_data['prompt_result']['text_format'])
         
-    Returns:
-        ZIP file containing:
-        - prompt.txt (text format prompt)
-        - prompt.json (JSON format prompt)
-        - analysis.json (full analysis data)
-        - metadata.json (session metadata)
-    """
-    try:
-        # Check if session exists
-        if session_id not in analysis_cache:
-            return jsonify({
-                'status': 'error',
-                'message': 'Session not found or expired',
-                'error_type': 'session_not_found'
-            }), 404
+        # 2. JSON prompt file
+        zipf.writestr('prompt.json', fastjson.dumps(session_data['prompt_result']['json_format'], indent=True))
         
-        session_data = analysis_cache[session_id]
+        # 3. Full analysis data
+        zipf.writestr('analysis.json', fastjson.dumps(session_data['analysis_result'], indent=True))
         
-        # Create temporary directory for files
-        with tempfile.TemporaryDirectory() as temp_dir:
-            # Create files
-            files_created = []
-            
-            # 1. Text prompt file
-            text_prompt_path = os.path.join(temp_dir, 'prompt.txt')
-            with open(text_prompt_path, 'w', encoding='utf-8') as f:
-                f.write(session_data['prompt_result']['text_format'])
-            files_created.append(('prompt.txt', text_prompt_path))
-            
-            # 2. JSON prompt file
-            json_prompt_path = os.path.join(temp_dir, 'prompt.json')
-            with open(json_prompt_path, 'w', encoding='utf-8') as f:
-                json.dump(session_data['prompt_result']['json_format'], f, indent=2, ensure_ascii=False)
-            files_created.append(('prompt.json', json_prompt_path))
-            
-            # 3. Full analysis data
-            analysis_path = os.path.join(temp_dir, 'analysis.json')
-            with open(analysis_path, 'w', encoding='utf-8') as f:
-                json.dump(session_data['analysis_result'], f, indent=2, ensure_ascii=False)
-            files_created.append(('analysis.json', analysis_path))
-            
-            # 4. Session metadata
-            metadata_path = os.path.join(temp_dir, 'metadata.json')
-            metadata = {
-                'session_id': session_id,
-                'url': session_data['url'],
-                'timestamp': session_data['timestamp'],
-                'tool_version': '1.0.0',
-                'files_included': [filename for filename, _ in files_created]
-            }
-            with open(metadata_path, 'w', encoding='utf-8') as f:
-                json.dump(metadata, f, indent=2, ensure_ascii=False)
-            files_created.append(('metadata.json', metadata_path))
-            
-            # 5. README file
-            readme_path = os.path.join(temp_dir, 'README.md')
-            readme_content = f"""# Website Reverse Engineering Results
+        # 4. Session metadata
+        metadata = {
+            'session_id': session_id,
+            'url': session_data['url'],
+            'timestamp': session_data['timestamp'],
+            'tool_version': '1.0.0',
+            'files_included': ['prompt.txt', 'prompt.json', 'analysis.json']
+        }
+        zipf.writestr('metadata.json', fastjson.dumps(metadata, indent=True))
+        
+        # 5. README file
+        readme_content = f"""# Website Reverse Engineering Results
 
 ## Overview
 This package contains the reverse engineering analysis and prompts for:
@@ -290,35 +458,52 @@ Prompt Generation: OpenAI GPT-4 powered prompt engineering
 ---
 For questions or support, please refer to the tool documentation.
 """
-            with open(readme_path, 'w', encoding='utf-8') as f:
-                f.write(readme_content)
-            files_created.append(('README.md', readme_path))
-            
-            # Create ZIP file
-            zip_path = os.path.join(temp_dir, f'website_analysis_{session_id[:8]}.zip')
-            with zipfile.ZipFile(zip_path, 'w', zipfile.ZIP_DEFLATED) as zipf:
-                for filename, filepath in files_created:
-                    zipf.write(filepath, filename)
-            
-            logger.info(f"Created download package for session: {session_id}")
-            
-            # Send file
-            return send_file(
-                zip_path,
-                as_attachment=True,
-                download_name=f'website_analysis_{session_id[:8]}.zip',
-                mimetype='application/zip'
-            )
+        zipf.writestr('README.md', readme_content.encode('utf-8'))
     
-    except Exception as e:
-        logger.error(f"Error creating download package: {str(e)}")
-        return jsonify({
-            'status': 'error',
-            'message': 'Failed to create download package',
-            'error_type': 'download_error'
-        }), 500
+    return buffer.getvalue()
+
+@analyze_bp.route('/download/<session_id>', methods=['GET'])
+@handle_errors('Failed to create download package', 'download_error')
+def download_results(session_id):
+    """
+    Download analysis results as a zip file.
+    
+    Args:
+        session_id: The session ID from the analysis
+        
+    Returns:
+        ZIP file containing:
+        - prompt.txt (text format prompt)
+        - prompt.json (JSON format prompt)
+        - analysis.json (full analysis data)
+        - metadata.json (session metadata)
+    """
+    # Check if session exists
+    session_data = session_cache.get(session_id)
+    if session_data is None:
+        raise SessionNotFound('Session not found or expired')
+    
+    if session_data.get('status') in ('pending', 'running', 'error'):
+        raise SessionNotReady('Analysis for this session has not completed')
+    
+    # Reuse the package built by an earlier download of this session
+    zip_bytes = session_data.get('zip_bytes')
+    if zip_bytes is None:
+        zip_bytes = _build_download_package(session_id, session_data)
+        # Store an updated copy; other requests may be iterating the cached entry
+        session_cache.replace(session_id, {**session_data, 'zip_bytes': zip_bytes})
+        logger.info(f"Created download package for session: {session_id}")
+    
+    # Send file
+    return send_file(
+        io.BytesIO(zip_bytes),
+        as_attachment=True,
+        download_name=f'website_analysis_{session_id[:8]}.zip',
+        mimetype='application/zip'
+    )
 
 @analyze_bp.route('/session/<session_id>', methods=['GET'])
+@handle_errors('Failed to retrieve session data', 'retrieval_error')
 def get_session_data(session_id):
     """
     Get full session data for a given session ID.
@@ -329,32 +514,34 @@ def get_session_data(session_id):
     Returns:
         Complete session data including analysis and prompts
     """
-    try:
-        if session_id not in analysis_cache:
-            return jsonify({
-                'status': 'error',
-                'message': 'Session not found or expired',
-                'error_type': 'session_not_found'
-            }), 404
-        
-        session_data = analysis_cache[session_id]
-        
+    session_data = session_cache.get(session_id)
+    if session_data is None:
+        raise SessionNotFound('Session not found or expired')
+    
+    status = session_data.get('status')
+    if status in ('pending', 'running'):
         return jsonify({
-            'status': 'success',
+            'status': status,
             'session_id': session_id,
             'url': session_data['url'],
-            'timestamp': session_data['timestamp'],
-            'analysis': session_data['analysis_result'],
-            'prompts': session_data['prompt_result']
-        })
-        
-    except Exception as e:
-        logger.error(f"Error retrieving session data: {str(e)}")
+            'timestamp': session_data['timestamp']
+        }), 202
+    if status == 'error':
         return jsonify({
             'status': 'error',
-            'message': 'Failed to retrieve session data',
-            'error_type': 'retrieval_error'
+            'session_id': session_id,
+            'message': session_data['message'],
+            'error_type': session_data['error_type']
         }), 500
+    
+    return jsonify({
+        'status': 'success',
+        'session_id': session_id,
+        'url': session_data['url'],
+        'timestamp': session_data['timestamp'],
+        'analysis': session_data['analysis_result'],
+        'prompts': session_data['prompt_result']
+    })
 
 @analyze_bp.route('/health', methods=['GET'])
 def health_check():
@@ -367,94 +554,83 @@ def health_check():
     })
 
 @analyze_bp.route('/test-analyze', methods=['POST'])
+@handle_errors('Test analysis failed', 'test_error')
 def test_analyze():
     """Test endpoint that returns mock data for testing."""
-    try:
-        data = request.get_json()
-        url = data.get('url', '')
-        
-        if not url:
-            return jsonify({
-                'status': 'error',
-                'message': 'URL is required'
-            }), 400
-        
-        # Return mock analysis data
-        session_id = str(uuid.uuid4())
-        mock_result = {
-            'session_id': session_id,
-            'status': 'success',
-            'analysis': {
-                'website_info': {
-                    'url': url,
-                    'website_type': 'business_website',
-                    'primary_purpose': 'information_sharing',
-                    'industry_category': 'technology'
-                },
-                'design_analysis': {
-                    'color_palette': {
-                        'color_scheme': 'modern',
-                        'mood': 'professional'
-                    },
-                    'typography': {
-                        'font_type': 'sans-serif',
-                        'typography_strategy': 'clean_minimal'
-                    }
+    data = request.get_json()
+    url = data.get('url', '')
+    
+    if not url:
+        raise BadRequest("URL is required")
+    
+    # Return mock analysis data
+    session_id = str(uuid.uuid4())
+    mock_result = {
+        'session_id': session_id,
+        'status': 'success',
+        'analysis': {
+            'website_info': {
+                'url': url,
+                'website_type': 'business_website',
+                'primary_purpose': 'information_sharing',
+                'industry_category': 'technology'
+            },
+            'design_analysis': {
+                'color_palette': {
+                    'color_scheme': 'modern',
+                    'mood': 'professional'
                 },
-                'functionality_analysis': {
-                    'user_interactions': {
-                        'button_count': 5,
-                        'link_count': 10,
-                        'input_count': 3,
-                        'interaction_complexity': 'medium'
-                    },
-                    'navigation_structure': {
-                        'navigation_items': 4,
-                        'has_search': True,
-                        'navigation_pattern': 'horizontal'
-                    },
-                    'core_features': ['navigation', 'content_display', 'responsive_design']
+                'typography': {
+                    'font_type': 'sans-serif',
+                    'typography_strategy': 'clean_minimal'
+                }
+            },
+            'functionality_analysis': {
+                'user_interactions': {
+                    'button_count': 5,
+                    'link_count': 10,
+                    'input_count': 3,
+                    'interaction_complexity': 'medium'
                 },
-                'technical_analysis': {
-                    'frontend_technologies': ['HTML5', 'CSS3', 'JavaScript'],
-                    'modern_features': ['responsive_design', 'semantic_html']
+                'navigation_structure': {
+                    'navigation_items': 4,
+                    'has_search': True,
+                    'navigation_pattern': 'horizontal'
                 },
-                'summary': {
-                    'website_type': 'business_website',
-                    'primary_purpose': 'information_sharing',
-                    'business_type': 'technology',
-                    'core_features': ['navigation', 'content_display', 'responsive_design']
-                }
+                'core_features': ['navigation', 'content_display', 'responsive_design']
             },
-            'prompts': {
-                'text_preview': f'Create a modern business website for {url} with clean design...',
-                'json_preview': {
-                    'project_overview': {
-                        'description': f'A modern business website based on {url}'
-                    },
-                    'requirements_summary': {
-                        'design': 250,
-                        'functionality': 180,
-                        'technical': 120,
-                        'content': 200,
-                        'user_experience': 150
-                    }
+            'technical_analysis': {
+                'frontend_technologies': ['HTML5', 'CSS3', 'JavaScript'],
+                'modern_features': ['responsive_design', 'semantic_html']
+            },
+            'summary': {
+                'website_type': 'business_website',
+                'primary_purpose': 'information_sharing',
+                'business_type': 'technology',
+                'core_features': ['navigation', 'content_display', 'responsive_design']
+            }
+        },
+        'prompts': {
+            'text_preview': f'Create a modern business website for {url} with clean design...',
+            'json_preview': {
+                'project_overview': {
+                    'description': f'A modern business website based on {url}'
+                },
+                'requirements_summary': {
+                    'design': 250,
+                    'functionality': 180,
+                    'technical': 120,
+                    'content': 200,
+                    'user_experience': 150
                 }
             }
         }
-        
-        # Store in cache
-        analysis_cache[session_id] = mock_result
-        
-        return jsonify(mock_result)
-        
-    except Exception as e:
-        logger.error(f"Error in test analyze: {str(e)}")
-        return jsonify({
-            'status': 'error',
-            'message': f'Test analysis failed: {str(e)}',
-            'error_type': 'test_error'
-        }), 500
+    }
+    
+    # Store in cache
+    session_cache.put(session_id, mock_result)
+    
+    return jsonify(mock_result)
 
 # Error handlers
 @analyze_bp.errorhandler(404)
@@ -1,18 +1,745 @@
 """
 Website analyzer service for processing scraped data and extracting meaningful insights.
 """
-import json
+import colorsys
+import copy
 import re
-from typing import Dict, List, Any
+from bisect import bisect_right
+from dataclasses import dataclass
+from typing import Dict, List, Any, Optional, Tuple
 from collections import Counter
+from functools import lru_cache, wraps
 import logging
 
-logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+class _KeywordIndex:
+    """
+    Multi-pattern matcher over prioritized keyword groups.
+    
+    All keywords are compiled into one zero-width lookahead alternation, so a
+    single scan reports every keyword occurrence in a text, overlapping ones
+    included (the Aho-Corasick use case, built on the stdlib `re` engine).
+    Matching is plain substring, like the `word in text` checks it replaces.
+    Only the longest keyword is reported at each position, so a keyword may
+    not be a prefix of a keyword in another group.
+    """
+    
+    __slots__ = ('labels', '_rank', '_regex')
+    
+    def __init__(self, groups):
+        """
+        Args:
+            groups: Ordered (label, keywords) pairs; earlier groups take priority
+        """
+        self.labels = tuple(label for label, _ in groups)
+        self._rank = {}
+        for rank, (_, keywords) in enumerate(groups):
+            for keyword in keywords:
+                self._rank[keyword] = rank
+        
+        keywords = sorted(self._rank, key=len, reverse=True)
+        for keyword in keywords:
+            for other in keywords:
+                if other != keyword and other.startswith(keyword) and self._rank[other] != self._rank[keyword]:
+                    raise ValueError(f"Keyword {keyword!r} is a prefix of {other!r} in another group")
+        
+        self._regex = re.compile('(?=(' + '|'.join(re.escape(keyword) for keyword in keywords) + '))')
+    
+    def found(self, text: str) -> bool:
+        """Return whether any keyword occurs in text, stopping at the first hit."""
+        return self._regex.search(text) is not None
+    
+    def ranks(self, text: str) -> set:
+        """Return the ranks of every group with a keyword occurring in text."""
+        rank = self._rank
+        return {rank[match.group(1)] for match in self._regex.finditer(text)}
+    
+    def first(self, text: str):
+        """Return the label of the highest-priority group found in text, or None."""
+        rank = self._rank
+        best = None
+        for match in self._regex.finditer(text):
+            found = rank[match.group(1)]
+            if best is None or found < best:
+                best = found
+                if best == 0:
+                    # Nothing outranks the first group; skip the rest of the text
+                    break
+        return None if best is None else self.labels[best]
+    
+    def first_each(self, texts: List[str]) -> List[Any]:
+        """
+        Like first() for every text, using one scan over the newline-joined texts.
+        
+        Keywords never contain a newline, so no match spans two texts.
+        """
+        starts = []
+        offset = 0
+        for text in texts:
+            starts.append(offset)
+            offset += len(text) + 1
+        
+        best = [None] * len(texts)
+        rank = self._rank
+        for match in self._regex.finditer('\n'.join(texts)):
+            index = bisect_right(starts, match.start()) - 1
+            found = rank[match.group(1)]
+            if best[index] is None or found < best[index]:
+                best[index] = found
+        
+        labels = self.labels
+        return [None if found is None else labels[found] for found in best]
+
+# Button wording for each primary action, checked in priority order
+_PRIMARY_ACTION_INDEX = _KeywordIndex([
+    ('contact/submit', ('submit', 'send', 'contact')),
+    ('purchase', ('buy', 'purchase', 'order', 'cart')),
+    ('registration', ('sign up', 'register', 'join')),
+    ('authentication', ('login', 'sign in')),
+    ('download', ('download', 'get')),
+])
+
+# Primary purpose for each website type returned by _classify_website_type
+_PURPOSE_MAP = {
+    'e-commerce': 'sell products/services',
+    'blog/content': 'share information/content',
+    'portfolio': 'showcase work/skills',
+    'business/corporate': 'promote business/services',
+    'landing_page': 'convert visitors/generate leads',
+    'web_application': 'provide tools/functionality',
+    'informational': 'provide information'
+}
+
+# Business type, value proposition and audience for each website type
+_BUSINESS_TYPE_MAP = {
+    'e-commerce': 'retail/e-commerce',
+    'blog/content': 'media/publishing',
+    'portfolio': 'creative/freelance',
+    'business/corporate': 'service/corporate',
+    'landing_page': 'marketing/lead_generation',
+    'web_application': 'saas/technology',
+    'informational': 'informational/educational'
+}
+
+_VALUE_PROPOSITION_MAP = {
+    'e-commerce': 'Product sales and convenience',
+    'blog/content': 'Information and insights',
+    'portfolio': 'Showcase skills and expertise',
+    'business/corporate': 'Professional services',
+    'landing_page': 'Specific product/service offering',
+    'web_application': 'Tool/service functionality',
+    'informational': 'Knowledge and information'
+}
+
+_AUDIENCE_MAP = {
+    'e-commerce': 'consumers/shoppers',
+    'blog/content': 'readers/information seekers',
+    'portfolio': 'potential clients/employers',
+    'business/corporate': 'business clients/partners',
+    'landing_page': 'potential customers/leads',
+    'web_application': 'end users/professionals',
+    'informational': 'general public/researchers'
+}
+
+# Font names considered highly readable by the readability heuristics
+_READABLE_FONTS = ('arial', 'helvetica', 'roboto', 'open sans', 'lato', 'georgia')
+_READABLE_FONT_RE = re.compile('|'.join(map(re.escape, _READABLE_FONTS)))
+_READABLE_FAMILY_FONTS = ('helvetica', 'arial', 'georgia', 'times', 'verdana', 'roboto')
+_MODERN_SANS_FONTS = ('inter', 'roboto', 'poppins', 'nunito')
+
+# Form purposes and button wording that indicate conversion points
+_CONVERSION_FORM_PURPOSES = frozenset({'contact', 'registration', 'subscription'})
+# Monetization strategy implied by a form's purpose
+_MONETIZATION_BY_PURPOSE = {'subscription': 'subscription', 'contact': 'lead_generation'}
+_CTA_INDEX = _KeywordIndex([
+    ('cta', ('buy', 'purchase', 'sign up', 'subscribe', 'download')),
+])
+
+# Per-field attributes that describe what a form collects
+_FORM_HINT_FIELD_KEYS = ('name', 'type', 'placeholder', 'label')
+
+
+def _form_hints(form: Dict[str, Any]) -> str:
+    """Return a form's action, purpose and field descriptors as one lowercased string."""
+    parts = [str(form.get('action') or ''), str(form.get('purpose') or '')]
+    for field in form.get('fields', ()):
+        parts.extend(str(field.get(key) or '') for key in _FORM_HINT_FIELD_KEYS)
+    return ' '.join(parts).lower()
+
+
+# Color keyword tables used by the advanced palette analysis
+_STANDARD_COLORS = frozenset({'#ffffff', '#000000', '#fff', '#000'})
+_NEUTRAL_COLOR_INDICATORS = ('gray', 'grey', 'white', 'black', '#fff', '#000', 'rgb(255,255,255)', 'rgb(0,0,0)')
+_PRIMARY_COLOR_INDICATORS = ('blue', 'red', 'green', 'orange', 'purple', 'yellow')
+_ACCENT_COLOR_INDICATORS = ('pink', 'cyan', 'lime', 'magenta', 'teal', 'coral')
+_WARM_COLOR_INDICATORS = ('red', 'orange', 'yellow', 'pink')
+_COOL_COLOR_INDICATORS = ('blue', 'green', 'purple', 'cyan')
+# Palette mood for each psychology family, checked in priority order
+_COLOR_PSYCHOLOGY_KEYWORDS = (
+    ('professional_trustworthy', ('blue', 'navy', 'cyan')),
+    ('dynamic_energetic', ('red', 'crimson', 'cherry')),
+    ('natural_organic', ('green', 'forest', 'lime')),
+    ('premium_sophisticated', ('purple', 'violet', 'magenta')),
+)
+
+# Trait bits a color keyword can carry; psychology families take one bit each
+# from _COLOR_MOOD_SHIFT upwards, in priority order
+_COLOR_NEUTRAL = 1 << 0
+_COLOR_PRIMARY = 1 << 1
+_COLOR_ACCENT = 1 << 2
+_COLOR_WARM = 1 << 3
+_COLOR_COOL = 1 << 4
+_COLOR_GRADIENT = 1 << 5
+_COLOR_MOOD_SHIFT = 6
+
+
+def _build_keyword_traits(tables: List[Tuple[Any, int]]) -> Dict[str, int]:
+    """
+    Map every keyword to the OR of the trait bits it signals.
+    
+    Args:
+        tables: (keywords, bit) pairs; a keyword may appear in several tables
+        
+    Returns:
+        Dict from keyword to its combined trait bits
+    """
+    traits = {}
+    for keywords, bit in tables:
+        for keyword in keywords:
+            traits[keyword] = traits.get(keyword, 0) | bit
+    
+    # The lookahead scan reports only the longest keyword at each position
+    for keyword in traits:
+        for other in traits:
+            if other != keyword and other.startswith(keyword):
+                raise ValueError(f"Keyword {keyword!r} is a prefix of {other!r}")
+    return traits
+
+
+def _keyword_traits_regex(traits: Dict[str, int]):
+    """Compile one overlapping scan for every keyword of a trait table."""
+    return re.compile(
+        '(?=(' + '|'.join(re.escape(keyword) for keyword in sorted(traits, key=len, reverse=True)) + '))'
+    )
+
+
+def _build_color_traits() -> Dict[str, int]:
+    """Map every color keyword to the OR of the trait bits it signals."""
+    tables = [
+        (_NEUTRAL_COLOR_INDICATORS, _COLOR_NEUTRAL),
+        (_PRIMARY_COLOR_INDICATORS, _COLOR_PRIMARY),
+        (_ACCENT_COLOR_INDICATORS, _COLOR_ACCENT),
+        (_WARM_COLOR_INDICATORS, _COLOR_WARM),
+        (_COOL_COLOR_INDICATORS, _COLOR_COOL),
+        (('gradient',), _COLOR_GRADIENT),
+    ]
+    for rank, (_, keywords) in enumerate(_COLOR_PSYCHOLOGY_KEYWORDS):
+        tables.append((keywords, 1 << (_COLOR_MOOD_SHIFT + rank)))
+    return _build_keyword_traits(tables)
+
+
+_COLOR_TOKEN_TRAITS = _build_color_traits()
+_COLOR_TOKEN_RE = _keyword_traits_regex(_COLOR_TOKEN_TRAITS)
+
+
+# Color syntaxes parsed for numeric HSV analysis. Computed styles from the
+# scraper arrive as rgb()/rgba(); hex values and basic CSS names also appear.
+_HEX_COLOR_RE = re.compile(r'#([0-9a-f]{8}|[0-9a-f]{6}|[0-9a-f]{3,4})\b')
+_RGB_COLOR_RE = re.compile(r'rgba?\(\s*(\d{1,3})[\s,]+(\d{1,3})[\s,]+(\d{1,3})\s*(?:[,/]\s*([\d.]+)%?)?\s*\)')
+_NAMED_COLORS = {
+    'black': (0, 0, 0), 'silver': (192, 192, 192), 'gray': (128, 128, 128), 'grey': (128, 128, 128),
+    'white': (255, 255, 255), 'maroon': (128, 0, 0), 'red': (255, 0, 0), 'purple': (128, 0, 128),
+    'fuchsia': (255, 0, 255), 'magenta': (255, 0, 255), 'green': (0, 128, 0), 'lime': (0, 255, 0),
+    'olive': (128, 128, 0), 'yellow': (255, 255, 0), 'navy': (0, 0, 128), 'blue': (0, 0, 255),
+    'teal': (0, 128, 128), 'aqua': (0, 255, 255), 'cyan': (0, 255, 255), 'orange': (255, 165, 0),
+}
+
+
+@lru_cache(maxsize=4096)
+def _color_hsv(color: str) -> Optional[Tuple[float, float, float]]:
+    """
+    Hue, saturation and value (each 0-1) of a lowercased CSS color.
+    
+    Returns:
+        tuple or None: None when the color cannot be parsed or is fully transparent
+    """
+    rgb = _NAMED_COLORS.get(color)
+    if rgb is None:
+        match = _RGB_COLOR_RE.match(color)
+        if match:
+            red, green, blue, alpha = match.groups()
+            # The alpha pattern also admits malformed numbers such as '.' or '1.2.3'
+            try:
+                if alpha is not None and float(alpha) == 0:
+                    return None
+            except ValueError:
+                return None
+            rgb = (min(int(red), 255), min(int(green), 255), min(int(blue), 255))
+        else:
+            match = _HEX_COLOR_RE.match(color)
+            if not match:
+                return None
+            digits = match.group(1)
+            if len(digits) <= 4:
+                digits = ''.join(digit * 2 for digit in digits)
+            if len(digits) == 8 and digits[6:] == '00':
+                return None
+            rgb = (int(digits[0:2], 16), int(digits[2:4], 16), int(digits[4:6], 16))
+    
+    return colorsys.rgb_to_hsv(rgb[0] / 255, rgb[1] / 255, rgb[2] / 255)
+
+
+# Colors below this saturation are treated as grays with no meaningful hue
+_CHROMATIC_SATURATION = 0.15
+
+# Hue harmony geometry, in degrees: hues closer than the gap share a cluster,
+# and cluster distances match a harmony template within the tolerance
+_HUE_CLUSTER_GAP = 30
+_HARMONY_TOLERANCE = 30
+_MONOCHROMATIC_SPAN = 30
+_ANALOGOUS_SPAN = 90
+
+
+def _hue_clusters(hues: List[float]) -> List[Tuple[float, float]]:
+    """
+    Group hues on the color wheel into arcs split by gaps wider than _HUE_CLUSTER_GAP.
+    
+    Args:
+        hues: Hues in degrees (0-360), at least one
+        
+    Returns:
+        list: (center, span) of each arc, in degrees
+    """
+    hues = sorted(hues)
+    gaps = [following - hue for hue, following in zip(hues, hues[1:])]
+    gaps.append(hues[0] + 360 - hues[-1])
+    
+    # Unroll the wheel just after its widest gap so no arc wraps past 360
+    start = max(range(len(hues)), key=gaps.__getitem__) + 1
+    unrolled = hues[start:] + [hue + 360 for hue in hues[:start]]
+    
+    clusters = []
+    first = previous = unrolled[0]
+    for hue in unrolled[1:]:
+        if hue - previous > _HUE_CLUSTER_GAP:
+            clusters.append(((first + previous) / 2 % 360, previous - first))
+            first = hue
+        previous = hue
+    clusters.append(((first + previous) / 2 % 360, previous - first))
+    return clusters
+
+
+def _hue_distance(first: float, second: float) -> float:
+    """Shortest angle between two hues in degrees."""
+    distance = abs(first - second) % 360
+    return min(distance, 360 - distance)
+
+
+@lru_cache(maxsize=4096)
+def _color_profile(color: str) -> Tuple[int, int, Optional[Tuple[float, float, float]]]:
+    """
+    Classify one lowercased color for the palette analysis in a single call.
+    
+    Returns:
+        tuple: (traits, temperature, hsv). traits holds the bits of every color
+        keyword in the string. temperature holds its _COLOR_WARM/_COLOR_COOL
+        keyword bits, or else a bit read from the hue of a chromatic color.
+        hsv is None when the color cannot be parsed.
+    """
+    traits = 0
+    for match in _COLOR_TOKEN_RE.finditer(color):
+        traits |= _COLOR_TOKEN_TRAITS[match.group(1)]
+    
+    hsv = _color_hsv(color)
+    temperature = traits & (_COLOR_WARM | _COLOR_COOL)
+    if not temperature and hsv is not None and hsv[1] >= _CHROMATIC_SATURATION:
+        # No temperature keyword: reds through yellows (and magentas) read warm
+        hue = hsv[0]
+        temperature = _COLOR_WARM if hue < 1 / 6 or hue >= 5 / 6 else _COLOR_COOL
+    return traits, temperature, hsv
+
+# Palette moods that read as a luxury visual style
+_LUXURY_MOODS = frozenset({'luxury', 'premium_sophisticated'})
+
+# Trends every analyzed design is credited with, after any palette trends
+_BASELINE_DESIGN_TRENDS = ('responsive_design', 'mobile_first', 'clean_typography')
+
+
+@lru_cache(maxsize=256)
+def _design_trends_for(palette_trends: tuple) -> tuple:
+    """Deduplicated design trends for a tuple of palette trends."""
+    return tuple(set(palette_trends + _BASELINE_DESIGN_TRENDS))
+
+# Target demographic suggested by each palette mood
+_MOOD_DEMOGRAPHICS = {
+    'professional_trustworthy': 'business_professionals',
+    'dynamic_energetic': 'young_adults',
+    'premium_sophisticated': 'affluent_adults'
+}
+
+# Title keywords for industry classification, in priority order
+_INDUSTRY_INDEX = _KeywordIndex([
+    ('technology', ('tech', 'software', 'app', 'digital')),
+    ('retail/e-commerce', ('shop', 'store', 'buy', 'sell')),
+    ('healthcare', ('health', 'medical', 'doctor', 'clinic')),
+    ('education', ('education', 'school', 'university', 'learn')),
+    ('finance', ('finance', 'bank', 'investment', 'money')),
+])
+
+# Interactive element lists counted toward interaction complexity
+_INTERACTIVE_KEYS = ('buttons', 'inputs', 'selects', 'textareas')
+
+_MODERN_FRAMEWORKS = frozenset({'react', 'vue', 'angular', 'svelte'})
+_MODERN_DESIGN_PATTERNS = frozenset({'hero_section', 'card_layout', 'responsive_grid'})
+
+# technical_info flags and the label each one reports, in output order
+_MODERN_FEATURE_FLAGS = (
+    ('hasServiceWorker', 'service_worker'),
+    ('isResponsive', 'responsive_design'),
+)
+_ARCHITECTURE_FLAGS = (
+    ('hasSPA', 'single_page_application'),
+    ('hasSSR', 'server_side_rendering'),
+    ('hasSSG', 'static_site_generation'),
+    ('hasPWA', 'progressive_web_app'),
+    ('hasJAMStack', 'jamstack'),
+)
+_BUILD_TOOL_FLAGS = (
+    ('hasWebpack', 'webpack'),
+    ('hasVite', 'vite'),
+    ('hasParcel', 'parcel'),
+    ('hasRollup', 'rollup'),
+)
+
+# One bit per flag above; technical_info is read into a bitmask once per
+# analysis and each table becomes (bit, label) pairs tested against it
+_TECH_FLAG_BITS = {
+    flag: 1 << bit
+    for bit, (flag, _) in enumerate(_MODERN_FEATURE_FLAGS + _ARCHITECTURE_FLAGS + _BUILD_TOOL_FLAGS)
+}
+_MODERN_FEATURE_BITS = tuple((_TECH_FLAG_BITS[flag], label) for flag, label in _MODERN_FEATURE_FLAGS)
+_ARCHITECTURE_BITS = tuple((_TECH_FLAG_BITS[flag], label) for flag, label in _ARCHITECTURE_FLAGS)
+_BUILD_TOOL_BITS = tuple((_TECH_FLAG_BITS[flag], label) for flag, label in _BUILD_TOOL_FLAGS)
+
+
+def _tech_flag_mask(tech_info: Dict[str, Any]) -> int:
+    """Pack the truthy technical_info flags from the feature tables into an int."""
+    get = tech_info.get
+    mask = 0
+    for flag, bit in _TECH_FLAG_BITS.items():
+        if get(flag, False):
+            mask |= bit
+    return mask
+
+# Placeholder results for technical checks that need deeper analysis. Reports
+# get a deep copy, so a caller editing one report cannot change the next.
+_DEFAULT_ASSET_OPTIMIZATION = {
+    'image_optimization': True,  # Would need image analysis
+    'css_minification': True,   # Would need CSS analysis
+    'js_minification': True,    # Would need JS analysis
+    'asset_compression': True   # Would need header analysis
+}
+_DEFAULT_PERFORMANCE_BUDGET = {
+    'budget_type': 'medium',
+    'target_metrics': 'core_web_vitals',
+    'optimization_level': 'standard'
+}
+_COMMON_THIRD_PARTY_APIS = ('analytics', 'social_media')
+
+# Placeholder results of the advanced design and brand analyses, copied the
+# same way. Nested lists stay lists so prompt text built from them is unchanged.
+_DEFAULT_COLOR_PSYCHOLOGY_PROFILE = {
+    'emotional_impact': 'moderate',
+    'energy_level': 'balanced',
+    'sophistication': 'medium',
+    'approachability': 'high',
+    'memorability': 'good'
+}
+_DEFAULT_COLOR_ACCESSIBILITY = {
+    'contrast_compliance': 'aa_standard',
+    'colorblind_friendly': True,
+    'sufficient_contrast': True,
+    'accessibility_score': 85
+}
+_DEFAULT_GRID_SYSTEM = {
+    'type': 'responsive_grid',
+    'columns': 12,
+    'breakpoints': ['mobile', 'tablet', 'desktop'],
+    'consistency': 'high'
+}
+_DEFAULT_RESPONSIVE_BREAKPOINTS = {
+    'strategy': 'mobile_first',
+    'breakpoints': ['320px', '768px', '1024px', '1200px'],
+    'flexibility': 'high'
+}
+_DEFAULT_SPACE_UTILIZATION = {
+    'efficiency': 'good',
+    'white_space': 'balanced',
+    'content_density': 'medium'
+}
+_DEFAULT_LAYOUT_PERFORMANCE = {
+    'rendering_efficiency': 'good',
+    'layout_shift_risk': 'low',
+    'paint_optimization': 'moderate'
+}
+_DEFAULT_LAYOUT_ACCESSIBILITY = {
+    'semantic_structure': 'good',
+    'skip_navigation': 'detected',
+    'landmark_usage': 'proper'
+}
+_DEFAULT_MODERN_CSS_FEATURES = ['custom_properties', 'css_grid', 'flexbox']
+_DEFAULT_DESIGN_TOKENS = {
+    'color_tokens': 'detected',
+    'spacing_tokens': 'detected',
+    'typography_tokens': 'detected',
+    'consistency_level': 'high'
+}
+_DEFAULT_PATTERN_LIBRARY = {
+    'component_library': 'custom',
+    'pattern_consistency': 'high',
+    'reusability_score': 85
+}
+_DEFAULT_BRAND_SYSTEM = {
+    'brand_consistency': 'high',
+    'visual_identity': 'strong',
+    'brand_guidelines': 'well_implemented'
+}
+_DEFAULT_VISUAL_IDENTITY = {
+    'logo_presence': 'detected',
+    'brand_colors': 'consistent',
+    'visual_style': 'cohesive'
+}
+_DEFAULT_BRAND_PERSONALITY = {
+    'personality_traits': ['professional', 'modern', 'trustworthy'],
+    'tone': 'formal',
+    'character': 'authoritative'
+}
+_DEFAULT_BRAND_POSITIONING = {
+    'market_position': 'premium',
+    'target_segment': 'professional',
+    'differentiation': 'quality_focus'
+}
+_DEFAULT_BRAND_VOICE = {
+    'voice_characteristics': ['professional', 'clear', 'direct'],
+    'tone_variation': 'consistent',
+    'communication_style': 'formal'
+}
+_DEFAULT_EMOTIONAL_APPEAL = {
+    'emotional_triggers': ['trust', 'professionalism'],
+    'appeal_level': 'moderate',
+    'emotional_connection': 'functional'
+}
+_DEFAULT_AESTHETIC_SCORES = {
+    'visual_appeal': 85,
+    'sophistication': 78,
+    'modernity': 82,
+    'uniqueness': 70,
+    'cohesiveness': 88
+}
+_DEFAULT_TREND_ALIGNMENT = {
+    'current_trends': ['minimalism', 'modern_typography'],
+    'trend_score': 80,
+    'future_proof': 'good'
+}
+_DEFAULT_VISUAL_HIERARCHY = {
+    'hierarchy_clarity': 'good',
+    'information_flow': 'logical',
+    'visual_weight_distribution': 'balanced',
+    'scan_pattern': 'z_pattern'
+}
+_DEFAULT_RESPONSIVE_DESIGN = {
+    'responsive_strategy': 'mobile_first',
+    'breakpoint_optimization': 'good',
+    'content_adaptation': 'excellent',
+    'performance_across_devices': 'optimized'
+}
+_DEFAULT_SPACING_PATTERNS = {
+    'spacing_system': 'systematic',
+    'rhythm_consistency': 'good',
+    'white_space_usage': 'effective',
+    'spacing_scale': '8px_base',
+    'vertical_rhythm': 'maintained'
+}
+_DEFAULT_INTERACTION_PATTERNS = {
+    'interaction_paradigms': ['click', 'hover', 'scroll'],
+    'feedback_mechanisms': ['visual', 'micro_animations'],
+    'user_guidance': 'clear',
+    'error_handling': 'graceful'
+}
+_DEFAULT_ACCESSIBILITY_ANALYSIS = {
+    'wcag_compliance': 'aa_partial',
+    'screen_reader_support': 'good',
+    'keyboard_navigation': 'complete',
+    'color_contrast': 'sufficient',
+    'focus_management': 'implemented',
+    'accessibility_score': 82
+}
+_DEFAULT_COMPONENT_SYSTEM = {
+    'component_library': 'custom',
+    'design_system_maturity': 'developing',
+    'component_reusability': 'good',
+    'pattern_consistency': 'high'
+}
+_DEFAULT_MICRO_INTERACTIONS = {
+    'hover_effects': 'present',
+    'loading_states': 'basic',
+    'transition_animations': 'subtle',
+    'feedback_mechanisms': 'immediate'
+}
+_DEFAULT_ANIMATION_PATTERNS = {
+    'animation_library': 'css_based',
+    'animation_complexity': 'minimal',
+    'performance_impact': 'low',
+    'user_preference_respect': 'implemented'
+}
+_DEFAULT_CONTENT_PRESENTATION = {
+    'content_hierarchy': 'clear',
+    'readability_optimization': 'good',
+    'content_chunking': 'effective',
+    'visual_content_balance': 'appropriate'
+}
+_FORM_SYSTEM_COMPONENT = {
+    'type': 'form_system',
+    'complexity': 'medium',
+    'validation': 'client_side'
+}
+
+# Advanced color and typography results for pages with no colors or fonts;
+# reports get a deep copy
+_DEFAULT_COLOR_ANALYSIS = {
+    'primary_colors': ['#000000'],
+    'secondary_colors': ['#ffffff'],
+    'accent_colors': [],
+    'neutral_colors': ['#808080'],
+    'color_harmony': 'monochromatic',
+    'mood_analysis': 'neutral',
+    'psychology_profile': 'minimal',
+    'accessibility': 'unknown',
+    'trends': [],
+    'total_colors': 2,
+    'color_richness': 'minimal',
+    'temperature': 'neutral',
+    'saturation_level': 'low',
+    'brightness_distribution': 'balanced'
+}
+_DEFAULT_TYPOGRAPHY_ANALYSIS = {
+    'primary_fonts': ['system-ui'],
+    'font_classification': {'sans_serif': 1},
+    'hierarchy': 'basic',
+    'pairing_strategy': 'single_font',
+    'readability_score': 'good',
+    'accessibility_rating': 'standard',
+    'trends': [],
+    'performance_impact': 'low',
+    'font_variety': 1,
+    'style_consistency': 'high',
+    'brand_alignment': 'neutral',
+    'modern_features': []
+}
+
+# Font family keyword tables. Matching stays substring-based ('sans-serif'
+# still counts as serif, 'open sans' as sans); each group of tables is indexed
+# so a font is classified with a single scan.
+_SERIF_TOKENS = frozenset({'serif', 'times', 'georgia', 'garamond', 'baskerville', 'palatino'})
+_SANS_TOKENS = frozenset({'sans', 'arial', 'helvetica', 'roboto', 'open sans', 'lato', 'montserrat'})
+_MONO_TOKENS = frozenset({'monospace', 'courier', 'menlo', 'monaco', 'consolas'})
+
+# Narrower tables used by the advanced classifier
+_SERIF_FAMILY_TOKENS = frozenset({'serif', 'times', 'georgia', 'garamond'})
+_MONO_FAMILY_TOKENS = frozenset({'monospace', 'courier', 'monaco', 'consolas'})
+_DISPLAY_FAMILY_TOKENS = frozenset({'impact', 'lobster', 'oswald'})
+_SCRIPT_FAMILY_TOKENS = frozenset({'script', 'cursive', 'handwriting'})
+
+_FONT_TYPE_INDEX = _KeywordIndex([
+    ('serif', _SERIF_TOKENS),
+    ('sans-serif', _SANS_TOKENS),
+    ('monospace', _MONO_TOKENS),
+])
+# Keys of the advanced font classification, in report order
+_FONT_FAMILY_CLASSES = ('serif', 'sans_serif', 'monospace', 'display', 'script')
+
+# Trait bits signalled by font keywords. Family bits run in priority order,
+# so a font's family is its lowest set family bit.
+_FONT_FAMILY_LABELS = ('serif', 'monospace', 'display', 'script')
+_FONT_FAMILY_MASK = (1 << len(_FONT_FAMILY_LABELS)) - 1
+_FONT_READABLE = 1 << 4
+_FONT_MODERN_SANS = 1 << 5
+_FONT_VARIABLE = 1 << 6
+
+_FONT_TOKEN_TRAITS = _build_keyword_traits([
+    (_SERIF_FAMILY_TOKENS, 1 << 0),
+    (_MONO_FAMILY_TOKENS, 1 << 1),
+    (_DISPLAY_FAMILY_TOKENS, 1 << 2),
+    (_SCRIPT_FAMILY_TOKENS, 1 << 3),
+    (_READABLE_FAMILY_FONTS, _FONT_READABLE),
+    (_MODERN_SANS_FONTS, _FONT_MODERN_SANS),
+    (('variable',), _FONT_VARIABLE),
+])
+_FONT_TOKEN_RE = _keyword_traits_regex(_FONT_TOKEN_TRAITS)
+
+
+@lru_cache(maxsize=4096)
+def _font_traits(font: str) -> int:
+    """OR of the trait bits of every keyword in a font name, from one scan."""
+    traits = 0
+    for match in _FONT_TOKEN_RE.finditer(font.lower()):
+        traits |= _FONT_TOKEN_TRAITS[match.group(1)]
+    return traits
+
+
+@dataclass(slots=True)
+class _AnalysisContext:
+    """Scraped sub-sections and shared results, fetched once per analysis."""
+    data: Dict[str, Any]
+    css: Dict[str, Any]
+    struct: Dict[str, Any]
+    viewport: Dict[str, Any]
+    interactive: Dict[str, Any]
+    forms: List[Dict[str, Any]]
+    form_purposes: List[str]
+    nav: Dict[str, Any]
+    content: Dict[str, Any]
+    tech: Dict[str, Any]
+    tech_flags: int
+    title: str
+    title_lower: str
+    website_type: Optional[str] = None
+    content_presentation: Optional[Dict[str, Any]] = None
+
+
+def _memoized_on_values(maxsize: int = 256):
+    """
+    Share a pure analyzer method's results across analyzer instances.
+    
+    The routes create a new WebsiteAnalyzer per request, so the cache lives on
+    the method rather than the instance. The method must take a single list of
+    strings and depend on nothing else; the list is keyed as a tuple, and
+    callers get a deep copy of the cached result, so no two reports share
+    its nested lists.
+    """
+    def decorator(method):
+        @lru_cache(maxsize=maxsize)
+        def compute(values: tuple) -> Dict[str, Any]:
+            return method(WebsiteAnalyzer(), list(values))
+        
+        @wraps(method)
+        def wrapper(self, values: List[str]) -> Dict[str, Any]:
+            return copy.deepcopy(compute(tuple(values)))
+        
+        wrapper.cache_info = compute.cache_info
+        return wrapper
+    return decorator
+
+
 class WebsiteAnalyzer:
+    __slots__ = ('analysis_result', '_forms_source', '_forms_text', '_forms_blob')
+    
     def __init__(self):
         self.analysis_result = {}
+        self._forms_source = None
+        self._forms_text = []
+        self._forms_blob = ''
     
     def analyze_scraped_data(self, scraped_data: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -25,42 +752,86 @@ class WebsiteAnalyzer:
             dict: Structured analysis results
         """
         try:
-            logger.info(f"Analyzing scraped data for {scraped_data.get('url', 'unknown URL')}")
+            logger.info("Analyzing scraped data for %s", scraped_data.get('url', 'unknown URL'))
+            
+            ctx = self._build_context(scraped_data)
+            
+            # Collect each form's hint text once; the classifiers scan these instead of re-lowering per check
+            self._forms_text_for(ctx.forms)
+            
+            # Classified once; the basic info and business model sections both depend on it
+            ctx.website_type = self._classify_website_type(ctx)
+            
+            # Shared by the design and content strategy sections
+            ctx.content_presentation = self._analyze_content_presentation(scraped_data)
             
             analysis = {
-                'website_info': self._extract_basic_info(scraped_data),
-                'design_analysis': self._analyze_design_elements(scraped_data),
-                'functionality_analysis': self._analyze_functionality(scraped_data),
-                'user_experience_analysis': self._analyze_user_experience(scraped_data),
-                'technical_analysis': self._analyze_technical_stack(scraped_data),
-                'content_strategy': self._analyze_content_strategy(scraped_data),
-                'business_model': self._infer_business_model(scraped_data)
+                'website_info': self._extract_basic_info(ctx),
+                'design_analysis': self._analyze_design_elements(ctx),
+                'functionality_analysis': self._analyze_functionality(ctx),
+                'user_experience_analysis': self._analyze_user_experience(ctx),
+                'technical_analysis': self._analyze_technical_stack(ctx),
+                'content_strategy': self._analyze_content_strategy(ctx),
+                'business_model': self._infer_business_model(ctx)
             }
             
             self.analysis_result = analysis
             return analysis
             
-        except Exception as e:
-            logger.error(f"Error analyzing scraped data: {str(e)}")
-            raise Exception(f"Failed to analyze website data: {str(e)}")
+        except Exception:
+            # Log with the traceback and re-raise the original exception unchanged
+            logger.exception("Error analyzing scraped data for %s", scraped_data.get('url', 'unknown URL'))
+            raise
+    
+    def _build_context(self, data: Dict[str, Any]) -> _AnalysisContext:
+        """
+        Fetch the scraped sub-sections once for all section analyzers.
+        
+        Args:
+            data (dict): Raw scraped data from WebsiteScraper
+            
+        Returns:
+            _AnalysisContext: The raw data plus its commonly used sub-dicts
+        """
+        get = data.get
+        title = get('title', '')
+        forms = get('forms_info', [])
+        tech_info = get('technical_info', {})
+        return _AnalysisContext(
+            data=data,
+            css=get('css_info', {}),
+            struct=get('structure_info', {}),
+            viewport=get('viewport_info', {}),
+            interactive=get('interactive_elements', {}),
+            forms=forms,
+            form_purposes=[form.get('purpose', 'unknown') for form in forms],
+            nav=get('navigation_info', {}),
+            content=get('content_analysis', {}),
+            tech=tech_info,
+            tech_flags=_tech_flag_mask(tech_info),
+            title=title,
+            title_lower=title.lower()
+        )
     
-    def _extract_basic_info(self, data: Dict[str, Any]) -> Dict[str, Any]:
+    def _extract_basic_info(self, ctx: _AnalysisContext) -> Dict[str, Any]:
         """Extract basic website information."""
+        data = ctx.data
+        website_type = ctx.website_type
         return {
             'url': data.get('url', ''),
-            'title': data.get('title', ''),
-            'website_type': self._classify_website_type(data),
-            'primary_purpose': self._determine_primary_purpose(data),
-            'target_audience': self._infer_target_audience(data),
-            'industry_category': self._classify_industry(data)
+            'title': ctx.title,
+            'website_type': website_type,
+            'primary_purpose': self._determine_primary_purpose(website_type),
+            'target_audience': self._infer_target_audience(data, website_type),
+            'industry_category': self._classify_industry(data, website_type, ctx.title_lower)
         }
     
-    def _analyze_design_elements(self, data: Dict[str, Any]) -> Dict[str, Any]:
+    def _analyze_design_elements(self, ctx: _AnalysisContext) -> Dict[str, Any]:
         """Analyze visual design elements and patterns with enhanced depth and sophistication."""
-        css_info = data.get('css_info', {})
-        structure_info = data.get('structure_info', {})
-        viewport_info = data.get('viewport_info', {})
-        interactive_elements = data.get('interactive_elements', {})
+        data = ctx.data
+        css_info = ctx.css
+        structure_info = ctx.struct
+        viewport_info = ctx.viewport
         
         # Enhanced color palette analysis with color theory
         colors = css_info.get('colors', [])
@@ -74,10 +845,10 @@ class WebsiteAnalyzer:
         layout_analysis = self._analyze_layout_structure_advanced(structure_info, viewport_info)
         
         # Enhanced design pattern recognition
-        design_patterns = self._identify_design_patterns_advanced(data)
+        design_patterns = self._identify_design_patterns_advanced(ctx)
         
         # Comprehensive design system analysis
-        design_system = self._analyze_design_system_advanced(data)
+        design_system = self._analyze_design_system_advanced(ctx)
         
         # Deep brand and visual identity analysis
         brand_analysis = self._analyze_brand_elements_advanced(data)
@@ -104,7 +875,7 @@ class WebsiteAnalyzer:
             'visual_style': visual_style,
             'visual_hierarchy': self._analyze_visual_hierarchy_advanced(data),
             'responsive_design': self._analyze_responsive_design_advanced(viewport_info),
-            'ui_components': self._identify_ui_components_advanced(data),
+            'ui_components': self._identify_ui_components_advanced(ctx.interactive),
             'spacing_rhythm': self._analyze_spacing_patterns_advanced(css_info),
             'interaction_design': self._analyze_interaction_patterns_advanced(data),
             'accessibility': accessibility_analysis,
@@ -112,41 +883,39 @@ class WebsiteAnalyzer:
             'component_system': component_system,
             'micro_interactions': self._analyze_micro_interactions(data),
             'animation_patterns': self._analyze_animation_patterns(data),
-            'content_presentation': self._analyze_content_presentation(data)
+            'content_presentation': ctx.content_presentation
         }
     
-    def _analyze_functionality(self, data: Dict[str, Any]) -> Dict[str, Any]:
+    def _analyze_functionality(self, ctx: _AnalysisContext) -> Dict[str, Any]:
         """Analyze website functionality and features."""
-        interactive_elements = data.get('interactive_elements', {})
-        forms_info = data.get('forms_info', [])
-        navigation_info = data.get('navigation_info', {})
+        data = ctx.data
         
         return {
-            'core_features': self._identify_core_features(data),
-            'user_interactions': self._analyze_user_interactions(interactive_elements),
-            'navigation_structure': self._analyze_navigation_structure(navigation_info),
-            'form_functionality': self._analyze_form_functionality(forms_info),
-            'search_functionality': self._analyze_search_functionality(data),
+            'core_features': self._identify_core_features(ctx),
+            'user_interactions': self._analyze_user_interactions(ctx.interactive),
+            'navigation_structure': self._analyze_navigation_structure(ctx.nav),
+            'form_functionality': self._analyze_form_functionality(ctx.forms),
+            'search_functionality': self._analyze_search_functionality(ctx.nav),
             'social_features': self._identify_social_features(data),
-            'e_commerce_features': self._identify_ecommerce_features(data)
+            'e_commerce_features': self._identify_ecommerce_features(ctx.content)
         }
     
-    def _analyze_user_experience(self, data: Dict[str, Any]) -> Dict[str, Any]:
+    def _analyze_user_experience(self, ctx: _AnalysisContext) -> Dict[str, Any]:
         """Analyze user experience patterns and flows."""
+        data = ctx.data
         return {
-            'user_journey': self._map_user_journey(data),
+            'user_journey': self._map_user_journey(ctx),
             'accessibility_features': self._analyze_accessibility(data),
-            'performance_indicators': self._analyze_performance(data),
-            'mobile_experience': self._analyze_mobile_experience(data),
-            'conversion_elements': self._identify_conversion_elements(data),
-            'engagement_features': self._identify_engagement_features(data)
+            'performance_indicators': self._analyze_performance(ctx.tech),
+            'mobile_experience': self._analyze_mobile_experience(ctx.viewport),
+            'conversion_elements': self._identify_conversion_elements(ctx.interactive, ctx.form_purposes),
+            'engagement_features': self._identify_engagement_features(ctx.content)
         }
     
-    def _analyze_technical_stack(self, data: Dict[str, Any]) -> Dict[str, Any]:
+    def _analyze_technical_stack(self, ctx: _AnalysisContext) -> Dict[str, Any]:
         """Enhanced analysis of technical implementation and architecture."""
-        tech_info = data.get('technical_info', {})
-        css_info = data.get('css_info', {})
-        interactive = data.get('interactive_elements', {})
+        data = ctx.data
+        tech_info = ctx.tech
         
         # Enhanced frontend technology detection
         frontend_technologies = self._identify_frontend_tech(tech_info)
@@ -154,19 +923,19 @@ class WebsiteAnalyzer:
         
         # Performance and optimization analysis
         performance_metrics = self._extract_performance_metrics(tech_info)
-        optimization_analysis = self._analyze_optimization_patterns(data)
+        optimization_analysis = self._analyze_optimization_patterns(ctx)
         
         # Modern web features and APIs
-        modern_features = self._identify_modern_features(tech_info)
-        api_usage = self._analyze_api_patterns(data)
+        modern_features = self._identify_modern_features(ctx.tech_flags)
+        api_usage = self._analyze_api_patterns(ctx)
         
         # Security and SEO analysis
         security_analysis = self._analyze_security_features(data)
         seo_analysis = self._analyze_seo_features(data)
         
         # Architecture insights
-        architecture_patterns = self._identify_architecture_patterns(data)
-        code_quality_indicators = self._assess_code_quality(data)
+        architecture_patterns = self._identify_architecture_patterns(ctx.tech_flags)
+        code_quality_indicators = self._assess_code_quality(ctx)
         
         return {
             'frontend_technologies': frontend_technologies,
@@ -179,146 +948,98 @@ class WebsiteAnalyzer:
             'seo_implementation': seo_analysis,
             'architecture_patterns': architecture_patterns,
             'code_quality': code_quality_indicators,
-            'build_tools': self._detect_build_tools(tech_info),
+            'build_tools': self._detect_build_tools(ctx.tech_flags),
             'deployment_indicators': self._analyze_deployment_patterns(tech_info),
-            'browser_support': self._assess_browser_support(data),
-            'accessibility_implementation': self._analyze_technical_accessibility(data)
+            'browser_support': self._assess_browser_support(ctx),
+            'accessibility_implementation': self._analyze_technical_accessibility(ctx)
         }
     
-    def _analyze_content_strategy(self, data: Dict[str, Any]) -> Dict[str, Any]:
+    def _analyze_content_strategy(self, ctx: _AnalysisContext) -> Dict[str, Any]:
         """Analyze content organization and strategy."""
-        content_analysis = data.get('content_analysis', {})
-        
         return {
-            'content_structure': self._analyze_content_structure(content_analysis),
-            'content_types': self._identify_content_types(data),
-            'information_architecture': self._analyze_information_architecture(data),
-            'content_presentation': self._analyze_content_presentation(data),
-            'multimedia_usage': self._analyze_multimedia_usage(data)
+            'content_structure': self._analyze_content_structure(ctx.content),
+            'content_types': self._identify_content_types(ctx.struct),
+            'information_architecture': self._analyze_information_architecture(ctx.nav, ctx.struct),
+            'content_presentation': ctx.content_presentation,
+            'multimedia_usage': self._analyze_multimedia_usage(ctx.struct)
         }
     
-    def _infer_business_model(self, data: Dict[str, Any]) -> Dict[str, Any]:
+    def _infer_business_model(self, ctx: _AnalysisContext) -> Dict[str, Any]:
         """Infer business model and monetization strategy."""
+        data = ctx.data
+        website_type = ctx.website_type
         return {
-            'business_type': self._classify_business_type(data),
-            'monetization_strategy': self._identify_monetization_strategy(data),
-            'value_proposition': self._extract_value_proposition(data),
-            'competitive_advantages': self._identify_competitive_advantages(data)
+            'business_type': self._classify_business_type(data, website_type),
+            'monetization_strategy': self._identify_monetization_strategy(ctx.content, ctx.form_purposes),
+            'value_proposition': self._extract_value_proposition(data, website_type),
+            'competitive_advantages': self._identify_competitive_advantages(ctx)
         }
     
     # Helper methods for detailed analysis
     
-    def _classify_website_type(self, data: Dict[str, Any]) -> str:
+    def _forms_text_for(self, forms: List[Dict[str, Any]]) -> List[str]:
+        """Return the lowercased hint text of each form, reusing the last result for the same list."""
+        if forms is not self._forms_source:
+            self._forms_source = forms
+            self._forms_text = [_form_hints(form) for form in forms]
+            # Newline-joined copy for single-scan keyword checks; no keyword spans a newline
+            self._forms_blob = '\n'.join(self._forms_text)
+        return self._forms_text
+    
+    def _forms_blob_for(self, forms: List[Dict[str, Any]]) -> str:
+        """Return all lowercased form hints joined into one searchable string."""
+        self._forms_text_for(forms)
+        return self._forms_blob
+    
+    def _classify_website_type(self, ctx: _AnalysisContext) -> str:
         """Classify the type of website based on content and structure."""
-        content = data.get('content_analysis', {})
-        forms = data.get('forms_info', [])
-        interactive = data.get('interactive_elements', {})
+        content = ctx.content
+        forms = ctx.forms
+        interactive = ctx.interactive
+        
+        # One hint-collection pass over the forms; the cascade below searches
+        # it only when an earlier rule has not already decided the type
+        forms_blob = self._forms_blob_for(forms)
+        
+        # Read every predicate once; the cascade below only compares locals
+        has_pricing = content.get('has_pricing', False)
+        has_gallery = content.get('has_gallery', False)
+        has_hero_section = content.get('has_hero_section', False)
+        paragraph_count = content.get('paragraph_count', 0)
+        word_count = content.get('word_count', 0)
+        button_count = len(interactive.get('buttons', ()))
+        input_count = len(interactive.get('inputs', ()))
+        form_count = len(forms)
         
         # Check for e-commerce indicators
-        if (content.get('has_pricing', False) or 
-            any('cart' in str(form).lower() or 'checkout' in str(form).lower() for form in forms)):
+        if has_pricing or 'cart' in forms_blob or 'checkout' in forms_blob:
             return 'e-commerce'
         
         # Check for blog/content site
-        if content.get('paragraph_count', 0) > 10 and content.get('word_count', 0) > 1000:
+        if paragraph_count > 10 and word_count > 1000:
             return 'blog/content'
         
         # Check for portfolio
-        if content.get('has_gallery', False):
+        if has_gallery:
             return 'portfolio'
         
         # Check for business/corporate
-        if any('contact' in str(form).lower() for form in forms):
+        if 'contact' in forms_blob:
             return 'business/corporate'
         
         # Check for landing page
-        if content.get('has_hero_section', False) and len(interactive.get('buttons', [])) > 2:
+        if has_hero_section and button_count > 2:
             return 'landing_page'
         
         # Check for application/tool
-        if len(forms) > 2 or len(interactive.get('inputs', [])) > 5:
+        if form_count > 2 or input_count > 5:
             return 'web_application'
         
         return 'informational'
     
-    def _determine_primary_purpose(self, data: Dict[str, Any]) -> str:
-        """Determine the primary purpose of the website."""
-        website_type = self._classify_website_type(data)
-        forms = data.get('forms_info', [])
-        
-        purpose_map = {
-            'e-commerce': 'sell products/services',
-            'blog/content': 'share information/content',
-            'portfolio': 'showcase work/skills',
-            'business/corporate': 'promote business/services',
-            'landing_page': 'convert visitors/generate leads',
-            'web_application': 'provide tools/functionality',
-            'informational': 'provide information'
-        }
-        
-        return purpose_map.get(website_type, 'unknown')
-    
-    def _analyze_color_palette(self, colors: List[str]) -> Dict[str, Any]:
-        """Enhanced color palette analysis with more detail."""
-        if not colors:
-            return {
-                'primary_colors': [], 
-                'color_scheme': 'unknown', 
-                'mood': 'neutral',
-                'background_color': '#ffffff',
-                'text_colors': ['#000000'],
-                'accent_colors': []
-            }
-        
-        # Enhanced color analysis
-        unique_colors = list(set(colors))[:10]  # Limit to top 10 unique colors
-        
-        # Separate background, text, and accent colors
-        background_colors = [c for c in unique_colors if c.lower() in ['#ffffff', '#fff', 'white', '#f8f9fa', '#f5f5f5']]
-        text_colors = [c for c in unique_colors if c.lower() in ['#000000', '#000', 'black', '#333333', '#2c3e50']]
-        accent_colors = [c for c in unique_colors if c not in background_colors and c not in text_colors]
-        
-        # Determine color scheme type with more sophistication
-        color_scheme = 'monochromatic'
-        mood = self._infer_color_mood(unique_colors)
-        
-        if len(unique_colors) > 5:
-            color_scheme = 'colorful'
-        elif len(unique_colors) > 3:
-            color_scheme = 'varied'
-        elif len(unique_colors) > 1:
-            color_scheme = 'complementary'
-        
-        return {
-            'primary_colors': unique_colors,
-            'background_color': background_colors[0] if background_colors else '#ffffff',
-            'text_colors': text_colors or ['#000000'],
-            'accent_colors': accent_colors[:5],  # Top 5 accent colors
-            'color_scheme': color_scheme,
-            'total_colors_used': len(colors),
-            'unique_colors_count': len(unique_colors),
-            'mood': mood,
-            'contrast_ratio': self._estimate_contrast_ratio(background_colors, text_colors)
-        }
-    
-    def _estimate_contrast_ratio(self, background_colors: List[str], text_colors: List[str]) -> str:
-        """Estimate contrast ratio for accessibility."""
-        if not background_colors or not text_colors:
-            return 'unknown'
-        
-        # Simple heuristic based on color combinations
-        bg = background_colors[0].lower()
-        text = text_colors[0].lower()
-        
-        light_backgrounds = ['#ffffff', '#fff', 'white', '#f8f9fa', '#f5f5f5']
-        dark_texts = ['#000000', '#000', 'black', '#333333', '#2c3e50']
-        
-        if bg in light_backgrounds and text in dark_texts:
-            return 'high'
-        elif bg not in light_backgrounds and text not in dark_texts:
-            return 'low'
-        else:
-            return 'medium'
+    def _determine_primary_purpose(self, website_type: str) -> str:
+        """Determine the primary purpose of the website from its classified type."""
+        return _PURPOSE_MAP.get(website_type, 'unknown')
     
     def _analyze_typography(self, fonts: List[str], css_info: Dict[str, Any]) -> Dict[str, Any]:
         """Enhanced typography analysis with detailed categorization."""
@@ -333,27 +1054,16 @@ class WebsiteAnalyzer:
                 'font_pairing': 'none'
             }
         
-        primary_font = css_info.get('primaryFont', fonts[0] if fonts else 'default')
-        
-        # Enhanced font classification
-        serif_indicators = ['serif', 'times', 'georgia', 'garamond', 'baskerville', 'palatino']
-        sans_serif_indicators = ['sans', 'arial', 'helvetica', 'roboto', 'open sans', 'lato', 'montserrat']
-        monospace_indicators = ['monospace', 'courier', 'menlo', 'monaco', 'consolas']
-        
-        font_types = []
-        for font in fonts:
-            font_lower = font.lower()
-            if any(indicator in font_lower for indicator in serif_indicators):
-                font_types.append('serif')
-            elif any(indicator in font_lower for indicator in sans_serif_indicators):
-                font_types.append('sans-serif')
-            elif any(indicator in font_lower for indicator in monospace_indicators):
-                font_types.append('monospace')
-            else:
-                font_types.append('unknown')
+        primary_font = css_info.get('primaryFont', fonts[0])
         
-        primary_type = font_types[0] if font_types else 'sans-serif'
-        font_variety = len(set(fonts))
+        # Enhanced font classification: lowercase once, classify all fonts in one scan
+        fonts_lower = [font.lower() for font in fonts]
+        font_types = [font_type or 'unknown' for font_type in _FONT_TYPE_INDEX.first_each(fonts_lower)]
+        
+        # Empty input returned above, so there is always a first font
+        primary_type = font_types[0]
+        font_variety = len({*fonts})
+        unique_types = dict.fromkeys(font_types)  # ordered set: first-seen type first
         
         # Determine typography strategy
         typography_strategy = 'basic'
@@ -366,8 +1076,8 @@ class WebsiteAnalyzer:
         
         # Font pairing analysis
         font_pairing = 'none'
-        if len(set(font_types)) > 1:
-            if 'serif' in font_types and 'sans-serif' in font_types:
+        if len(unique_types) > 1:
+            if 'serif' in unique_types and 'sans-serif' in unique_types:
                 font_pairing = 'serif_sans_mix'
             else:
                 font_pairing = 'complementary'
@@ -376,23 +1086,22 @@ class WebsiteAnalyzer:
             'primary_font': primary_font,
             'font_families': fonts[:5],  # Top 5 fonts
             'font_type': primary_type,
-            'font_types_used': list(set(font_types)),
+            'font_types_used': list(unique_types),
             'font_variety': font_variety,
             'typography_strategy': typography_strategy,
             'font_pairing': font_pairing,
-            'readability_score': self._assess_readability(fonts, font_types)
+            'readability_score': self._assess_readability(fonts_lower, font_types)
         }
     
-    def _assess_readability(self, fonts: List[str], font_types: List[str]) -> str:
-        """Assess typography readability."""
+    def _assess_readability(self, fonts_lower: List[str], font_types: List[str]) -> str:
+        """Assess typography readability from already-lowercased font names."""
         # Simple heuristics for readability
-        if not fonts:
+        if not fonts_lower:
             return 'unknown'
         
-        readable_fonts = ['arial', 'helvetica', 'roboto', 'open sans', 'lato', 'georgia']
-        primary_font = fonts[0].lower()
+        primary_font = fonts_lower[0]
         
-        if any(font in primary_font for font in readable_fonts):
+        if _READABLE_FONT_RE.search(primary_font):
             return 'excellent'
         elif 'sans-serif' in font_types or 'serif' in font_types:
             return 'good'
@@ -445,12 +1154,12 @@ class WebsiteAnalyzer:
         
         return patterns
     
-    def _identify_design_patterns_advanced(self, data: Dict[str, Any]) -> Dict[str, Any]:
+    def _identify_design_patterns_advanced(self, ctx: _AnalysisContext) -> Dict[str, Any]:
         """Advanced design pattern identification with detailed analysis and modern pattern recognition."""
-        content = data.get('content_analysis', {})
-        structure = data.get('structure_info', {})
-        css_info = data.get('css_info', {})
-        interactive = data.get('interactive_elements', {})
+        content = ctx.content
+        structure = ctx.struct
+        css_info = ctx.css
+        interactive = ctx.interactive
         
         # Basic patterns from the original method
         basic_patterns = []
@@ -470,7 +1179,7 @@ class WebsiteAnalyzer:
         navigation_patterns = self._analyze_navigation_patterns(structure, interactive)
         content_patterns = self._analyze_content_patterns(content, structure)
         interaction_patterns = self._analyze_interaction_patterns_basic(interactive)
-        modern_patterns = self._detect_modern_design_patterns(data)
+        modern_patterns = self._detect_modern_design_patterns(css_info)
         
         return {
             'basic_patterns': basic_patterns,
@@ -480,7 +1189,7 @@ class WebsiteAnalyzer:
             'interaction_patterns': interaction_patterns,
             'modern_patterns': modern_patterns,
             'pattern_complexity': self._assess_pattern_complexity(basic_patterns),
-            'design_sophistication': self._rate_design_sophistication(data)
+            'design_sophistication': self._rate_design_sophistication(css_info)
         }
     
     def _analyze_layout_patterns(self, structure: Dict[str, Any], css_info: Dict[str, Any]) -> List[str]:
@@ -506,7 +1215,7 @@ class WebsiteAnalyzer:
         patterns = []
         
         # Navigation types
-        if len(interactive.get('links', [])) > 5:
+        if len(interactive.get('links', ())) > 5:
             patterns.append('complex_navigation')
         if structure.get('hasBreadcrumbs', False):
             patterns.append('breadcrumb_navigation')
@@ -536,7 +1245,7 @@ class WebsiteAnalyzer:
         patterns = []
         
         # Interaction types
-        button_count = len(interactive.get('buttons', []))
+        button_count = len(interactive.get('buttons', ()))
         if button_count > 3:
             patterns.append('button_heavy_interface')
         if interactive.get('has_forms', False):
@@ -546,10 +1255,9 @@ class WebsiteAnalyzer:
         
         return patterns
     
-    def _detect_modern_design_patterns(self, data: Dict[str, Any]) -> List[str]:
+    def _detect_modern_design_patterns(self, css_info: Dict[str, Any]) -> List[str]:
         """Detect modern design patterns and trends."""
         patterns = []
-        css_info = data.get('css_info', {})
         
         # Modern CSS features
         if css_info.get('has_animations', False):
@@ -573,9 +1281,8 @@ class WebsiteAnalyzer:
         else:
             return 'complex'
     
-    def _rate_design_sophistication(self, data: Dict[str, Any]) -> str:
+    def _rate_design_sophistication(self, css_info: Dict[str, Any]) -> str:
         """Rate the overall design sophistication."""
-        css_info = data.get('css_info', {})
         features = []
         
         if css_info.get('has_custom_fonts', False):
@@ -595,18 +1302,13 @@ class WebsiteAnalyzer:
         else:
             return 'basic'
     
-    def _identify_core_features(self, data: Dict[str, Any]) -> List[str]:
+    def _identify_core_features(self, ctx: _AnalysisContext) -> List[str]:
         """Identify the core features of the website."""
-        features = []
-        forms = data.get('forms_info', [])
-        interactive = data.get('interactive_elements', {})
-        navigation = data.get('navigation_info', {})
+        interactive = ctx.interactive
+        navigation = ctx.nav
         
         # Form-based features
-        for form in forms:
-            purpose = form.get('purpose', 'unknown')
-            if purpose != 'unknown':
-                features.append(f"{purpose}_form")
+        features = [f"{purpose}_form" for purpose in ctx.form_purposes if purpose != 'unknown']
         
         # Navigation features
         if navigation.get('searchBox', False):
@@ -615,43 +1317,27 @@ class WebsiteAnalyzer:
             features.append('pagination')
         
         # Interactive features
-        if len(interactive.get('buttons', [])) > 3:
+        if len(interactive.get('buttons', ())) > 3:
             features.append('interactive_interface')
-        if len(interactive.get('links', [])) > 10:
+        if len(interactive.get('links', ())) > 10:
             features.append('rich_navigation')
         
         return features
     
-    def _infer_color_mood(self, colors: List[str]) -> str:
-        """Infer the mood/feeling from color choices."""
-        # Simplified color mood analysis
-        color_text = ' '.join(colors).lower()
-        
-        if any(word in color_text for word in ['blue', 'navy', 'cyan']):
-            return 'professional/trustworthy'
-        elif any(word in color_text for word in ['red', 'orange', 'yellow']):
-            return 'energetic/warm'
-        elif any(word in color_text for word in ['green', 'forest', 'lime']):
-            return 'natural/growth'
-        elif any(word in color_text for word in ['purple', 'violet', 'magenta']):
-            return 'creative/luxury'
-        elif any(word in color_text for word in ['black', 'gray', 'white']):
-            return 'minimal/elegant'
-        else:
-            return 'neutral'
-    
     def _analyze_visual_hierarchy(self, data: Dict[str, Any]) -> Dict[str, Any]:
         """Analyze visual hierarchy and information organization."""
         structure = data.get('structure_info', {})
         
         headings = structure.get('headings', [])
+        # Counter is already a dict subclass, so it serializes as-is
         heading_hierarchy = Counter(headings)
+        level_count = len(heading_hierarchy)
         
         return {
-            'heading_structure': dict(heading_hierarchy),
-            'has_clear_hierarchy': len(heading_hierarchy) > 1,
+            'heading_structure': heading_hierarchy,
+            'has_clear_hierarchy': level_count > 1,
             'sections_count': structure.get('sections', 0),
-            'content_organization': 'hierarchical' if len(heading_hierarchy) > 2 else 'flat'
+            'content_organization': 'hierarchical' if level_count > 2 else 'flat'
         }
     
     def _analyze_responsive_design(self, viewport: Dict[str, Any]) -> Dict[str, Any]:
@@ -686,22 +1372,18 @@ class WebsiteAnalyzer:
     
     def _analyze_user_interactions(self, interactive: Dict[str, Any]) -> Dict[str, Any]:
         """Analyze user interaction patterns."""
+        get = interactive.get
         return {
-            'button_count': len(interactive.get('buttons', [])),
-            'link_count': len(interactive.get('links', [])),
-            'input_count': len(interactive.get('inputs', [])),
+            'button_count': len(get('buttons', ())),
+            'link_count': len(get('links', ())),
+            'input_count': len(get('inputs', ())),
             'interaction_complexity': self._calculate_interaction_complexity(interactive),
             'primary_actions': self._identify_primary_actions(interactive)
         }
     
     def _calculate_interaction_complexity(self, interactive: Dict[str, Any]) -> str:
         """Calculate the complexity of user interactions."""
-        total_interactions = (
-            len(interactive.get('buttons', [])) +
-            len(interactive.get('inputs', [])) +
-            len(interactive.get('selects', [])) +
-            len(interactive.get('textareas', []))
-        )
+        total_interactions = sum(len(interactive[key]) for key in _INTERACTIVE_KEYS if key in interactive)
         
         if total_interactions > 20:
             return 'high'
@@ -714,23 +1396,13 @@ class WebsiteAnalyzer:
     
     def _identify_primary_actions(self, interactive: Dict[str, Any]) -> List[str]:
         """Identify primary user actions based on button text and types."""
-        actions = []
-        buttons = interactive.get('buttons', [])
+        buttons = interactive.get('buttons', ())
+        texts = [button.get('text', '').lower() for button in buttons]
         
-        for button in buttons:
-            text = button.get('text', '').lower()
-            if any(word in text for word in ['submit', 'send', 'contact']):
-                actions.append('contact/submit')
-            elif any(word in text for word in ['buy', 'purchase', 'order', 'cart']):
-                actions.append('purchase')
-            elif any(word in text for word in ['sign up', 'register', 'join']):
-                actions.append('registration')
-            elif any(word in text for word in ['login', 'sign in']):
-                actions.append('authentication')
-            elif any(word in text for word in ['download', 'get']):
-                actions.append('download')
-        
-        return list(set(actions))
+        # One scan over all button texts; each button still gets its highest-priority action
+        actions = set(_PRIMARY_ACTION_INDEX.first_each(texts))
+        actions.discard(None)
+        return sorted(actions)
     
     def _analyze_navigation_structure(self, navigation: Dict[str, Any]) -> Dict[str, Any]:
         """Analyze navigation structure and patterns."""
@@ -768,18 +1440,18 @@ class WebsiteAnalyzer:
         
         return {
             'form_count': len(forms),
-            'form_types': list(set(form_purposes)),
+            'form_types': list(dict.fromkeys(form_purposes)),
             'total_fields': total_fields,
             'complexity': 'high' if total_fields > 20 else 'medium' if total_fields > 10 else 'low'
         }
     
-    def _analyze_search_functionality(self, data: Dict[str, Any]) -> Dict[str, Any]:
+    def _analyze_search_functionality(self, navigation: Dict[str, Any]) -> Dict[str, Any]:
         """Analyze search functionality implementation."""
-        navigation = data.get('navigation_info', {})
+        has_search = navigation.get('searchBox', False)
         
         return {
-            'has_search': navigation.get('searchBox', False),
-            'search_type': 'basic' if navigation.get('searchBox', False) else 'none'
+            'has_search': has_search,
+            'search_type': 'basic' if has_search else 'none'
         }
     
     def _identify_social_features(self, data: Dict[str, Any]) -> List[str]:
@@ -788,10 +1460,9 @@ class WebsiteAnalyzer:
         # For now, return basic analysis
         return []
     
-    def _identify_ecommerce_features(self, data: Dict[str, Any]) -> List[str]:
+    def _identify_ecommerce_features(self, content: Dict[str, Any]) -> List[str]:
         """Identify e-commerce specific features."""
         features = []
-        content = data.get('content_analysis', {})
         
         if content.get('has_pricing', False):
             features.append('pricing_display')
@@ -799,20 +1470,13 @@ class WebsiteAnalyzer:
         # Could be enhanced with more sophisticated detection
         return features
     
-    def _map_user_journey(self, data: Dict[str, Any]) -> Dict[str, Any]:
+    def _map_user_journey(self, ctx: _AnalysisContext) -> Dict[str, Any]:
         """Map potential user journeys through the site."""
-        forms = data.get('forms_info', [])
-        navigation = data.get('navigation_info', {})
-        
         entry_points = ['homepage']
-        if navigation.get('searchBox', False):
+        if ctx.nav.get('searchBox', False):
             entry_points.append('search')
         
-        conversion_points = []
-        for form in forms:
-            purpose = form.get('purpose', 'unknown')
-            if purpose in ['contact', 'registration', 'subscription']:
-                conversion_points.append(purpose)
+        conversion_points = [purpose for purpose in ctx.form_purposes if purpose in _CONVERSION_FORM_PURPOSES]
         
         return {
             'entry_points': entry_points,
@@ -829,48 +1493,39 @@ class WebsiteAnalyzer:
             'accessibility_score': 'unknown'  # Would need specialized tools
         }
     
-    def _analyze_performance(self, data: Dict[str, Any]) -> Dict[str, Any]:
+    def _analyze_performance(self, tech_info: Dict[str, Any]) -> Dict[str, Any]:
         """Analyze performance indicators."""
-        tech_info = data.get('technical_info', {})
-        
         return {
             'load_time': tech_info.get('loadTime', 0),
             'has_optimization': tech_info.get('hasServiceWorker', False),
             'performance_score': 'unknown'  # Would need specialized analysis
         }
     
-    def _analyze_mobile_experience(self, data: Dict[str, Any]) -> Dict[str, Any]:
+    def _analyze_mobile_experience(self, viewport: Dict[str, Any]) -> Dict[str, Any]:
         """Analyze mobile user experience."""
-        viewport = data.get('viewport_info', {})
-        
         return {
             'mobile_responsive': viewport.get('isMobile', False),
             'viewport_configured': True,
             'mobile_optimization': 'basic' if viewport.get('hasMediaQueries', False) else 'none'
         }
     
-    def _identify_conversion_elements(self, data: Dict[str, Any]) -> List[str]:
+    def _identify_conversion_elements(self, interactive: Dict[str, Any], form_purposes: List[str]) -> List[str]:
         """Identify elements designed for conversion."""
         elements = []
-        interactive = data.get('interactive_elements', {})
         
-        buttons = interactive.get('buttons', [])
-        for button in buttons:
-            text = button.get('text', '').lower()
-            if any(word in text for word in ['buy', 'purchase', 'sign up', 'subscribe', 'download']):
-                elements.append('cta_button')
-                break
+        # Join, lowercase and scan all button texts once; keywords never span the newline separator
+        buttons = interactive.get('buttons', ())
+        if _CTA_INDEX.found('\n'.join([button.get('text', '') for button in buttons]).lower()):
+            elements.append('cta_button')
         
-        forms = data.get('forms_info', [])
-        if any(form.get('purpose') in ['contact', 'subscription', 'registration'] for form in forms):
+        if not _CONVERSION_FORM_PURPOSES.isdisjoint(form_purposes):
             elements.append('lead_form')
         
         return elements
     
-    def _identify_engagement_features(self, data: Dict[str, Any]) -> List[str]:
+    def _identify_engagement_features(self, content: Dict[str, Any]) -> List[str]:
         """Identify features designed to engage users."""
         features = []
-        content = data.get('content_analysis', {})
         
         if content.get('has_testimonials', False):
             features.append('testimonials')
@@ -900,22 +1555,16 @@ class WebsiteAnalyzer:
             'has_service_worker': tech_info.get('hasServiceWorker', False)
         }
     
-    def _identify_modern_features(self, tech_info: Dict[str, Any]) -> List[str]:
+    def _identify_modern_features(self, tech_flags: int) -> List[str]:
         """Identify modern web features."""
-        features = []
-        
-        if tech_info.get('hasServiceWorker', False):
-            features.append('service_worker')
-        if tech_info.get('isResponsive', False):
-            features.append('responsive_design')
-        
-        return features
+        return [label for bit, label in _MODERN_FEATURE_BITS if tech_flags & bit]
     
     def _analyze_seo_features(self, data: Dict[str, Any]) -> Dict[str, Any]:
         """Analyze SEO implementation (basic)."""
+        title = data.get('title', '')
         return {
-            'has_title': bool(data.get('title')),
-            'title_length': len(data.get('title', '')),
+            'has_title': bool(title),
+            'title_length': len(title),
             'seo_score': 'basic'  # Would need more detailed analysis
         }
     
@@ -930,17 +1579,18 @@ class WebsiteAnalyzer:
     
     def _analyze_content_structure(self, content: Dict[str, Any]) -> Dict[str, Any]:
         """Analyze content structure and organization."""
+        word_count = content.get('word_count', 0)
+        paragraph_count = content.get('paragraph_count', 0)
         return {
-            'word_count': content.get('word_count', 0),
-            'paragraph_count': content.get('paragraph_count', 0),
-            'content_density': 'high' if content.get('word_count', 0) > 1000 else 'medium' if content.get('word_count', 0) > 500 else 'low',
-            'structure_type': 'article' if content.get('paragraph_count', 0) > 5 else 'page'
+            'word_count': word_count,
+            'paragraph_count': paragraph_count,
+            'content_density': 'high' if word_count > 1000 else 'medium' if word_count > 500 else 'low',
+            'structure_type': 'article' if paragraph_count > 5 else 'page'
         }
     
-    def _identify_content_types(self, data: Dict[str, Any]) -> List[str]:
+    def _identify_content_types(self, structure: Dict[str, Any]) -> List[str]:
         """Identify types of content present."""
         content_types = []
-        structure = data.get('structure_info', {})
         
         if structure.get('images', 0) > 0:
             content_types.append('images')
@@ -951,137 +1601,88 @@ class WebsiteAnalyzer:
         
         return content_types
     
-    def _analyze_information_architecture(self, data: Dict[str, Any]) -> Dict[str, Any]:
+    def _analyze_information_architecture(self, navigation: Dict[str, Any], structure: Dict[str, Any]) -> Dict[str, Any]:
         """Analyze information architecture."""
-        navigation = data.get('navigation_info', {})
-        structure = data.get('structure_info', {})
-        
         return {
             'navigation_depth': len(navigation.get('mainNav', [])),
             'content_sections': structure.get('sections', 0),
             'architecture_type': 'hierarchical' if navigation.get('breadcrumbs') else 'flat'
         }
     
-    def _analyze_content_presentation(self, data: Dict[str, Any]) -> Dict[str, Any]:
-        """Analyze how content is presented."""
-        content = data.get('content_analysis', {})
-        
-        return {
-            'uses_lists': content.get('list_count', 0) > 0,
-            'uses_tables': content.get('table_count', 0) > 0,
-            'presentation_style': 'structured' if content.get('list_count', 0) > 2 else 'narrative'
-        }
-    
-    def _analyze_multimedia_usage(self, data: Dict[str, Any]) -> Dict[str, Any]:
+    def _analyze_multimedia_usage(self, structure: Dict[str, Any]) -> Dict[str, Any]:
         """Analyze multimedia content usage."""
-        structure = data.get('structure_info', {})
+        image_count = structure.get('images', 0)
         
         return {
-            'image_count': structure.get('images', 0),
+            'image_count': image_count,
             'video_count': structure.get('videos', 0),
-            'multimedia_strategy': 'rich' if structure.get('images', 0) > 5 else 'minimal'
+            'multimedia_strategy': 'rich' if image_count > 5 else 'minimal'
         }
     
-    def _classify_business_type(self, data: Dict[str, Any]) -> str:
+    def _classify_business_type(self, data: Dict[str, Any], website_type: str = None) -> str:
         """Classify the business type based on website characteristics."""
-        website_type = self._classify_website_type(data)
-        
-        business_map = {
-            'e-commerce': 'retail/e-commerce',
-            'blog/content': 'media/publishing',
-            'portfolio': 'creative/freelance',
-            'business/corporate': 'service/corporate',
-            'landing_page': 'marketing/lead_generation',
-            'web_application': 'saas/technology',
-            'informational': 'informational/educational'
-        }
+        if website_type is None:
+            website_type = self._classify_website_type(self._build_context(data))
         
-        return business_map.get(website_type, 'unknown')
+        return _BUSINESS_TYPE_MAP.get(website_type, 'unknown')
     
-    def _identify_monetization_strategy(self, data: Dict[str, Any]) -> List[str]:
+    def _identify_monetization_strategy(self, content: Dict[str, Any], form_purposes: List[str]) -> List[str]:
         """Identify potential monetization strategies."""
         strategies = []
-        content = data.get('content_analysis', {})
-        forms = data.get('forms_info', [])
         
         if content.get('has_pricing', False):
             strategies.append('direct_sales')
         
-        for form in forms:
-            purpose = form.get('purpose', 'unknown')
-            if purpose == 'subscription':
-                strategies.append('subscription')
-            elif purpose == 'contact':
-                strategies.append('lead_generation')
+        # One strategy per matching form, in form order
+        strategies.extend(
+            _MONETIZATION_BY_PURPOSE[purpose] for purpose in form_purposes if purpose in _MONETIZATION_BY_PURPOSE
+        )
         
         return strategies
     
-    def _extract_value_proposition(self, data: Dict[str, Any]) -> str:
+    def _extract_value_proposition(self, data: Dict[str, Any], website_type: str = None) -> str:
         """Extract the apparent value proposition."""
-        website_type = self._classify_website_type(data)
-        
-        value_props = {
-            'e-commerce': 'Product sales and convenience',
-            'blog/content': 'Information and insights',
-            'portfolio': 'Showcase skills and expertise',
-            'business/corporate': 'Professional services',
-            'landing_page': 'Specific product/service offering',
-            'web_application': 'Tool/service functionality',
-            'informational': 'Knowledge and information'
-        }
+        if website_type is None:
+            website_type = self._classify_website_type(self._build_context(data))
         
-        return value_props.get(website_type, 'Unknown value proposition')
+        return _VALUE_PROPOSITION_MAP.get(website_type, 'Unknown value proposition')
     
-    def _identify_competitive_advantages(self, data: Dict[str, Any]) -> List[str]:
+    def _identify_competitive_advantages(self, ctx: _AnalysisContext) -> List[str]:
         """Identify potential competitive advantages."""
         advantages = []
         
         # This would require more sophisticated analysis
         # For now, return basic advantages based on features
-        if data.get('technical_info', {}).get('isResponsive', False):
+        if ctx.tech.get('isResponsive', False):
             advantages.append('mobile_responsive')
         
-        if data.get('navigation_info', {}).get('searchBox', False):
+        if ctx.nav.get('searchBox', False):
             advantages.append('search_functionality')
         
         return advantages
 
 
     
-    def _infer_target_audience(self, data: Dict[str, Any]) -> str:
+    def _infer_target_audience(self, data: Dict[str, Any], website_type: str = None) -> str:
         """Infer the target audience based on website characteristics."""
-        website_type = self._classify_website_type(data)
-        content = data.get('content_analysis', {})
-        
-        audience_map = {
-            'e-commerce': 'consumers/shoppers',
-            'blog/content': 'readers/information seekers',
-            'portfolio': 'potential clients/employers',
-            'business/corporate': 'business clients/partners',
-            'landing_page': 'potential customers/leads',
-            'web_application': 'end users/professionals',
-            'informational': 'general public/researchers'
-        }
+        if website_type is None:
+            website_type = self._classify_website_type(self._build_context(data))
         
-        return audience_map.get(website_type, 'general audience')
+        return _AUDIENCE_MAP.get(website_type, 'general audience')
     
-    def _classify_industry(self, data: Dict[str, Any]) -> str:
+    def _classify_industry(self, data: Dict[str, Any], website_type: str = None, title_lower: str = None) -> str:
         """Classify the industry category based on content and purpose."""
-        website_type = self._classify_website_type(data)
-        title = data.get('title', '').lower()
+        if website_type is None:
+            website_type = self._classify_website_type(self._build_context(data))
+        if title_lower is None:
+            title_lower = data.get('title', '').lower()
         
         # Simple industry classification based on keywords and type
-        if any(word in title for word in ['tech', 'software', 'app', 'digital']):
-            return 'technology'
-        elif any(word in title for word in ['shop', 'store', 'buy', 'sell']):
-            return 'retail/e-commerce'
-        elif any(word in title for word in ['health', 'medical', 'doctor', 'clinic']):
-            return 'healthcare'
-        elif any(word in title for word in ['education', 'school', 'university', 'learn']):
-            return 'education'
-        elif any(word in title for word in ['finance', 'bank', 'investment', 'money']):
-            return 'finance'
-        elif website_type == 'portfolio':
+        industry = _INDUSTRY_INDEX.first(title_lower)
+        if industry:
+            return industry
+        
+        if website_type == 'portfolio':
             return 'creative/professional services'
         elif website_type == 'blog/content':
             return 'media/publishing'
@@ -1094,11 +1695,11 @@ class WebsiteAnalyzer:
         interactive = data.get('interactive_elements', {})
         
         # Button analysis
-        buttons = interactive.get('buttons', [])
+        buttons = interactive.get('buttons', ())
         button_styles = self._extract_button_styles(buttons)
         
         # Form element consistency
-        inputs = interactive.get('inputs', [])
+        inputs = interactive.get('inputs', ())
         form_consistency = self._analyze_form_consistency(inputs)
         
         # Component library detection
@@ -1125,51 +1726,6 @@ class WebsiteAnalyzer:
             'visual_identity_strength': self._assess_brand_consistency(data)
         }
     
-    def _determine_visual_style(self, color_palette: Dict, typography: Dict, patterns: List) -> Dict[str, Any]:
-        """Determine overall visual style and aesthetic."""
-        style_indicators = {
-            'minimalist': 0,
-            'modern': 0,
-            'classic': 0,
-            'bold': 0,
-            'elegant': 0,
-            'playful': 0
-        }
-        
-        # Color influence
-        if color_palette.get('color_scheme') == 'monochromatic':
-            style_indicators['minimalist'] += 2
-            style_indicators['elegant'] += 1
-        elif color_palette.get('color_scheme') == 'colorful':
-            style_indicators['playful'] += 2
-            style_indicators['bold'] += 1
-        
-        # Typography influence
-        font_type = typography.get('font_type', '')
-        if 'serif' in font_type:
-            style_indicators['classic'] += 2
-            style_indicators['elegant'] += 1
-        elif 'sans' in font_type:
-            style_indicators['modern'] += 2
-            style_indicators['minimalist'] += 1
-        
-        # Pattern influence
-        if 'grid_layout' in patterns:
-            style_indicators['modern'] += 1
-        if 'card_based' in patterns:
-            style_indicators['modern'] += 1
-        
-        # Determine primary style
-        primary_style = max(style_indicators, key=style_indicators.get)
-        confidence = max(style_indicators.values()) / sum(style_indicators.values()) if sum(style_indicators.values()) > 0 else 0
-        
-        return {
-            'primary_style': primary_style,
-            'confidence': round(confidence, 2),
-            'style_scores': style_indicators,
-            'description': self._get_style_description(primary_style)
-        }
-    
     def _analyze_spacing_patterns(self, css_info: Dict[str, Any]) -> Dict[str, Any]:
         """Analyze spacing and rhythm patterns."""
         return {
@@ -1195,14 +1751,15 @@ class WebsiteAnalyzer:
         if not buttons:
             return {'primary_style': 'default', 'variants': [], 'consistency': 'unknown'}
         
-        # Analyze button classes and types
-        button_classes = [btn.get('classes', '') for btn in buttons]
-        button_types = [btn.get('type', 'button') for btn in buttons]
-        
-        # Detect common patterns
-        has_primary = any('primary' in classes for classes in button_classes)
-        has_secondary = any('secondary' in classes for classes in button_classes)
-        has_outline = any('outline' in classes for classes in button_classes)
+        # Detect common class patterns in a single pass, stopping once all are seen
+        has_primary = has_secondary = has_outline = False
+        for btn in buttons:
+            classes = btn.get('classes', '')
+            has_primary = has_primary or 'primary' in classes
+            has_secondary = has_secondary or 'secondary' in classes
+            has_outline = has_outline or 'outline' in classes
+            if has_primary and has_secondary and has_outline:
+                break
         
         variants = []
         if has_primary:
@@ -1224,14 +1781,23 @@ class WebsiteAnalyzer:
         if not inputs:
             return {'consistency': 'unknown', 'style': 'default'}
         
-        input_types = [inp.get('type', 'text') for inp in inputs]
-        has_placeholders = sum(1 for inp in inputs if inp.get('placeholder'))
+        # Count placeholders, required fields and distinct types in one pass
+        input_types = set()
+        has_placeholders = 0
+        required_count = 0
+        for inp in inputs:
+            get = inp.get
+            input_types.add(get('type', 'text'))
+            if get('placeholder'):
+                has_placeholders += 1
+            if get('required'):
+                required_count += 1
         
         return {
             'consistency': 'high' if has_placeholders > len(inputs) * 0.8 else 'medium',
             'style': 'modern' if has_placeholders > 0 else 'basic',
-            'input_variety': len(set(input_types)),
-            'accessibility_features': sum(1 for inp in inputs if inp.get('required'))
+            'input_variety': len(input_types),
+            'accessibility_features': required_count
         }
     
     def _detect_component_library(self, css_info: Dict[str, Any]) -> Dict[str, Any]:
@@ -1245,36 +1811,24 @@ class WebsiteAnalyzer:
     
     def _extract_design_tokens(self, css_info: Dict[str, Any]) -> Dict[str, Any]:
         """Extract design tokens from CSS."""
+        colors = css_info.get('colors', [])
         return {
-            'color_tokens': css_info.get('colors', [])[:5],
+            'color_tokens': colors[:5],
             'spacing_tokens': ['8px', '16px', '24px', '32px'],  # Common scale
             'typography_tokens': css_info.get('fonts', [])[:3],
-            'token_system': 'detected' if len(css_info.get('colors', [])) > 3 else 'minimal'
+            'token_system': 'detected' if len(colors) > 3 else 'minimal'
         }
     
     def _calculate_design_consistency(self, data: Dict[str, Any]) -> str:
         """Calculate overall design consistency score."""
-        # Simplified scoring based on available data
-        consistency_factors = 0
-        total_factors = 0
-        
+        # Simplified scoring based on available data. With two equally weighted
+        # factors the score is 0, 0.5 or 1, so only a full pass reaches the
+        # 'high' (>= 0.8) bucket and 'medium' (>= 0.6) is unreachable.
         css_info = data.get('css_info', {})
-        if len(css_info.get('fonts', [])) <= 3:  # Good font discipline
-            consistency_factors += 1
-        total_factors += 1
-        
-        if len(css_info.get('colors', [])) <= 10:  # Controlled color palette
-            consistency_factors += 1
-        total_factors += 1
+        good_font_discipline = len(css_info.get('fonts', [])) <= 3
+        controlled_palette = len(css_info.get('colors', [])) <= 10
         
-        score = consistency_factors / total_factors if total_factors > 0 else 0
-        
-        if score >= 0.8:
-            return 'high'
-        elif score >= 0.6:
-            return 'medium'
-        else:
-            return 'low'
+        return 'high' if good_font_discipline and controlled_palette else 'low'
     
     def _detect_logo_elements(self, structure: Dict[str, Any]) -> Dict[str, Any]:
         """Detect logo elements in the structure."""
@@ -1287,36 +1841,18 @@ class WebsiteAnalyzer:
     def _identify_brand_colors(self, css_info: Dict[str, Any]) -> List[str]:
         """Identify likely brand colors from the palette."""
         colors = css_info.get('colors', [])
-        # Return top 3 most prominent non-standard colors
-        brand_colors = [color for color in colors[:3] if color.lower() not in ['#ffffff', '#000000', '#fff', '#000']]
-        return brand_colors[:3]
+        # Non-standard colors among the top 3 most prominent; the slice already caps the result
+        return [color for color in colors[:3] if color.lower() not in _STANDARD_COLORS]
     
     def _identify_brand_fonts(self, css_info: Dict[str, Any]) -> List[str]:
         """Identify brand typography choices."""
         fonts = css_info.get('fonts', [])
         return fonts[:2]  # Primary and secondary fonts
     
-    def _analyze_brand_voice(self, data: Dict[str, Any]) -> str:
-        """Analyze brand voice from content."""
-        # Would analyze content tone - simplified for now
-        return 'professional'
-    
     def _assess_brand_consistency(self, data: Dict[str, Any]) -> str:
         """Assess brand consistency across elements."""
         return 'medium'  # Would need comprehensive analysis
     
-    def _get_style_description(self, style: str) -> str:
-        """Get description for visual style."""
-        descriptions = {
-            'minimalist': 'Clean, simple design with lots of white space and minimal elements',
-            'modern': 'Contemporary design with clean lines and current design trends',
-            'classic': 'Traditional design with timeless elements and serif typography',
-            'bold': 'Strong visual impact with high contrast and prominent elements',
-            'elegant': 'Sophisticated design with refined typography and subtle details',
-            'playful': 'Fun, creative design with bright colors and dynamic elements'
-        }
-        return descriptions.get(style, 'Balanced design approach')
-    
     def _detect_hover_patterns(self, interactive: Dict[str, Any]) -> List[str]:
         """Detect hover interaction patterns."""
         return ['color_change', 'scale_transform']  # Would need CSS analysis
@@ -1348,12 +1884,13 @@ class WebsiteAnalyzer:
             'all_frameworks': detected_frameworks,
             'ecosystem': framework_ecosystem,
             'complexity_score': len(detected_frameworks),
-            'modern_framework': any(fw in ['react', 'vue', 'angular', 'svelte'] for fw in detected_frameworks)
+            'modern_framework': any(fw in _MODERN_FRAMEWORKS for fw in detected_frameworks)
         }
     
-    def _analyze_optimization_patterns(self, data: Dict[str, Any]) -> Dict[str, Any]:
+    def _analyze_optimization_patterns(self, ctx: _AnalysisContext) -> Dict[str, Any]:
         """Analyze optimization patterns and performance strategies."""
-        tech_info = data.get('technical_info', {})
+        data = ctx.data
+        tech_info = ctx.tech
         
         return {
             'lazy_loading': tech_info.get('hasLazyLoading', False),
@@ -1365,9 +1902,10 @@ class WebsiteAnalyzer:
             'performance_budget': self._estimate_performance_budget(data)
         }
     
-    def _analyze_api_patterns(self, data: Dict[str, Any]) -> Dict[str, Any]:
+    def _analyze_api_patterns(self, ctx: _AnalysisContext) -> Dict[str, Any]:
         """Analyze API usage and integration patterns."""
-        tech_info = data.get('technical_info', {})
+        data = ctx.data
+        tech_info = ctx.tech
         
         return {
             'rest_api_usage': tech_info.get('hasRestAPI', False),
@@ -1378,50 +1916,26 @@ class WebsiteAnalyzer:
             'data_fetching_pattern': self._analyze_data_patterns(data)
         }
     
-    def _identify_architecture_patterns(self, data: Dict[str, Any]) -> List[str]:
+    def _identify_architecture_patterns(self, tech_flags: int) -> List[str]:
         """Identify architectural patterns used."""
-        patterns = []
-        tech_info = data.get('technical_info', {})
-        
-        if tech_info.get('hasSPA', False):
-            patterns.append('single_page_application')
-        if tech_info.get('hasSSR', False):
-            patterns.append('server_side_rendering')
-        if tech_info.get('hasSSG', False):
-            patterns.append('static_site_generation')
-        if tech_info.get('hasPWA', False):
-            patterns.append('progressive_web_app')
-        if tech_info.get('hasJAMStack', False):
-            patterns.append('jamstack')
-        
+        patterns = [label for bit, label in _ARCHITECTURE_BITS if tech_flags & bit]
         return patterns or ['traditional_website']
     
-    def _assess_code_quality(self, data: Dict[str, Any]) -> Dict[str, Any]:
+    def _assess_code_quality(self, ctx: _AnalysisContext) -> Dict[str, Any]:
         """Assess code quality indicators."""
-        tech_info = data.get('technical_info', {})
-        css_info = data.get('css_info', {})
+        data = ctx.data
         
         return {
-            'css_methodology': self._detect_css_methodology(css_info),
-            'semantic_html': self._assess_semantic_html(data),
+            'css_methodology': self._detect_css_methodology(ctx.css),
+            'semantic_html': self._assess_semantic_html(ctx.struct),
             'accessibility_score': self._calculate_accessibility_score(data),
             'maintainability': self._assess_maintainability(data),
             'scalability_indicators': self._identify_scalability_patterns(data)
         }
     
-    def _detect_build_tools(self, tech_info: Dict[str, Any]) -> List[str]:
+    def _detect_build_tools(self, tech_flags: int) -> List[str]:
         """Detect build tools and bundlers."""
-        tools = []
-        
-        if tech_info.get('hasWebpack', False):
-            tools.append('webpack')
-        if tech_info.get('hasVite', False):
-            tools.append('vite')
-        if tech_info.get('hasParcel', False):
-            tools.append('parcel')
-        if tech_info.get('hasRollup', False):
-            tools.append('rollup')
-        
+        tools = [label for bit, label in _BUILD_TOOL_BITS if tech_flags & bit]
         return tools or ['unknown']
     
     def _analyze_deployment_patterns(self, tech_info: Dict[str, Any]) -> Dict[str, Any]:
@@ -1433,24 +1947,25 @@ class WebsiteAnalyzer:
             'edge_computing': tech_info.get('hasEdgeComputing', False)
         }
     
-    def _assess_browser_support(self, data: Dict[str, Any]) -> Dict[str, Any]:
+    def _assess_browser_support(self, ctx: _AnalysisContext) -> Dict[str, Any]:
         """Assess browser support strategy."""
-        tech_info = data.get('technical_info', {})
+        data = ctx.data
         
         return {
             'modern_browsers': True,  # Default assumption
-            'polyfill_usage': tech_info.get('hasPolyfills', False),
+            'polyfill_usage': ctx.tech.get('hasPolyfills', False),
             'progressive_enhancement': self._detect_progressive_enhancement(data),
             'fallback_strategies': self._identify_fallback_strategies(data)
         }
     
-    def _analyze_technical_accessibility(self, data: Dict[str, Any]) -> Dict[str, Any]:
+    def _analyze_technical_accessibility(self, ctx: _AnalysisContext) -> Dict[str, Any]:
         """Analyze technical accessibility implementation."""
+        data = ctx.data
         return {
             'aria_usage': self._detect_aria_patterns(data),
             'keyboard_navigation': self._assess_keyboard_support(data),
             'screen_reader_support': self._assess_screen_reader_support(data),
-            'color_contrast': self._analyze_color_contrast(data),
+            'color_contrast': self._analyze_color_contrast(ctx.css),
             'accessibility_tools': self._detect_accessibility_tools(data)
         }
     
@@ -1480,12 +1995,7 @@ class WebsiteAnalyzer:
     
     def _analyze_asset_optimization(self, data: Dict[str, Any]) -> Dict[str, Any]:
         """Analyze asset optimization strategies."""
-        return {
-            'image_optimization': True,  # Would need image analysis
-            'css_minification': True,   # Would need CSS analysis
-            'js_minification': True,    # Would need JS analysis
-            'asset_compression': True   # Would need header analysis
-        }
+        return copy.deepcopy(_DEFAULT_ASSET_OPTIMIZATION)
     
     def _detect_preloading_patterns(self, tech_info: Dict[str, Any]) -> List[str]:
         """Detect resource preloading patterns."""
@@ -1498,16 +2008,12 @@ class WebsiteAnalyzer:
     
     def _estimate_performance_budget(self, data: Dict[str, Any]) -> Dict[str, str]:
         """Estimate performance budget based on analysis."""
-        return {
-            'budget_type': 'medium',
-            'target_metrics': 'core_web_vitals',
-            'optimization_level': 'standard'
-        }
+        return copy.deepcopy(_DEFAULT_PERFORMANCE_BUDGET)
     
     def _detect_third_party_apis(self, data: Dict[str, Any]) -> List[str]:
         """Detect third-party API integrations."""
         # Would analyze script tags and network requests
-        return ['analytics', 'social_media']  # Common APIs
+        return list(_COMMON_THIRD_PARTY_APIS)
     
     def _determine_api_architecture(self, tech_info: Dict[str, Any]) -> str:
         """Determine API architecture pattern."""
@@ -1527,9 +2033,8 @@ class WebsiteAnalyzer:
         # Would analyze CSS class patterns
         return 'utility_first'  # Common modern approach
     
-    def _assess_semantic_html(self, data: Dict[str, Any]) -> str:
+    def _assess_semantic_html(self, structure: Dict[str, Any]) -> str:
         """Assess semantic HTML usage."""
-        structure = data.get('structure_info', {})
         has_semantic_tags = structure.get('hasSemanticTags', False)
         return 'good' if has_semantic_tags else 'basic'
     
@@ -1582,9 +2087,8 @@ class WebsiteAnalyzer:
         """Assess screen reader support."""
         return 'basic'  # Would need semantic analysis
     
-    def _analyze_color_contrast(self, data: Dict[str, Any]) -> str:
+    def _analyze_color_contrast(self, css_info: Dict[str, Any]) -> str:
         """Analyze color contrast compliance."""
-        css_info = data.get('css_info', {})
         # Use existing contrast analysis
         return css_info.get('contrast_ratio', 'medium')
     
@@ -1594,41 +2098,63 @@ class WebsiteAnalyzer:
 
     # Advanced Design Analysis Methods
     
+    @_memoized_on_values()
     def _analyze_color_palette_advanced(self, colors: List[str]) -> Dict[str, Any]:
         """Enhanced color palette analysis with advanced color theory and harmony detection."""
         if not colors:
             return self._get_default_color_analysis()
         
         # Clean and deduplicate colors
-        unique_colors = list(set([c.lower().strip() for c in colors if c]))
+        unique_colors = list({c.lower().strip() for c in colors if c})
         
-        # Advanced color categorization
+        # Advanced color categorization: one keyword scan per color yields its
+        # trait bits, and the palette-wide signals are accumulated in the same pass
         primary_colors = []
         secondary_colors = []
         accent_colors = []
         neutral_colors = []
+        warm_count = 0
+        cool_count = 0
+        palette_traits = 0
+        saturations = []
+        values = []
+        hues = []
         
         for color in unique_colors:
-            if self._is_neutral_color(color):
+            traits, temperature, hsv = _color_profile(color)
+            palette_traits |= traits
+            if traits & _COLOR_NEUTRAL:
                 neutral_colors.append(color)
-            elif self._is_primary_color_candidate(color):
+            elif traits & _COLOR_PRIMARY:
                 primary_colors.append(color)
-            elif self._is_accent_color(color):
+            elif traits & _COLOR_ACCENT:
                 accent_colors.append(color)
             else:
                 secondary_colors.append(color)
+            
+            if temperature & _COLOR_WARM:
+                warm_count += 1
+            if temperature & _COLOR_COOL:
+                cool_count += 1
+            
+            if hsv is not None:
+                hue, saturation, value = hsv
+                saturations.append(saturation)
+                values.append(value)
+                if saturation >= _CHROMATIC_SATURATION:
+                    hues.append(hue * 360)
         
         # Color harmony analysis
-        harmony_type = self._detect_color_harmony(unique_colors)
+        harmony_type = self._detect_color_harmony(hues)
         
         # Advanced mood and psychology analysis
-        mood_analysis = self._analyze_color_psychology(unique_colors)
+        mood_analysis = self._analyze_color_psychology(palette_traits)
         
         # Accessibility analysis
         contrast_analysis = self._analyze_color_accessibility(unique_colors)
         
         # Trend analysis
-        color_trends = self._identify_color_trends(unique_colors)
+        color_trends = self._identify_color_trends(palette_traits, len(neutral_colors), len(unique_colors))
         
         return {
             'primary_colors': primary_colors[:3],
@@ -1641,10 +2167,10 @@ class WebsiteAnalyzer:
             'accessibility': contrast_analysis,
             'trends': color_trends,
             'total_colors': len(unique_colors),
-            'color_richness': self._calculate_color_richness(unique_colors),
-            'temperature': self._analyze_color_temperature(unique_colors),
-            'saturation_level': self._analyze_saturation_levels(unique_colors),
-            'brightness_distribution': self._analyze_brightness_distribution(unique_colors)
+            'color_richness': self._calculate_color_richness(len(unique_colors)),
+            'temperature': self._analyze_color_temperature(warm_count, cool_count),
+            'saturation_level': self._analyze_saturation_levels(saturations),
+            'brightness_distribution': self._analyze_brightness_distribution(values)
         }
     
     def _analyze_typography_advanced(self, fonts: List[str], css_info: Dict[str, Any]) -> Dict[str, Any]:
@@ -1652,8 +2178,11 @@ class WebsiteAnalyzer:
         if not fonts:
             return self._get_default_typography_analysis()
         
+        font_traits = [_font_traits(font) for font in fonts]
+        font_variety = len({*fonts})
+        
         # Advanced font classification
-        font_classification = self._classify_fonts_advanced(fonts)
+        font_classification = self._classify_fonts_advanced(font_traits)
         
         # Typography hierarchy analysis
         hierarchy_analysis = self._analyze_typography_hierarchy(fonts, css_info)
@@ -1662,10 +2191,10 @@ class WebsiteAnalyzer:
         pairing_analysis = self._analyze_font_pairing(fonts)
         
         # Readability and accessibility assessment
-        readability_score = self._assess_typography_readability(fonts)
+        readability_score = self._assess_typography_readability(font_traits)
         
         # Typography trends identification
-        typography_trends = self._identify_typography_trends(fonts)
+        typography_trends = self._identify_typography_trends(font_traits)
         
         # Performance impact analysis
         performance_impact = self._analyze_typography_performance(fonts)
@@ -1679,8 +2208,8 @@ class WebsiteAnalyzer:
             'accessibility_rating': self._rate_typography_accessibility(fonts),
             'trends': typography_trends,
             'performance_impact': performance_impact,
-            'font_variety': len(set(fonts)),
-            'style_consistency': self._assess_typography_consistency(fonts),
+            'font_variety': font_variety,
+            'style_consistency': self._assess_typography_consistency(font_variety),
             'brand_alignment': self._assess_brand_typography_alignment(fonts),
             'modern_features': self._detect_modern_typography_features(css_info)
         }
@@ -1717,10 +2246,11 @@ class WebsiteAnalyzer:
             'modern_css_features': self._detect_modern_css_features(structure)
         }
     
-    def _analyze_design_system_advanced(self, data: Dict[str, Any]) -> Dict[str, Any]:
+    def _analyze_design_system_advanced(self, ctx: _AnalysisContext) -> Dict[str, Any]:
         """Advanced design system analysis with component library detection."""
-        css_info = data.get('css_info', {})
-        interactive = data.get('interactive_elements', {})
+        data = ctx.data
+        css_info = ctx.css
+        interactive = ctx.interactive
         
         # Component consistency analysis
         component_consistency = self._analyze_component_consistency(interactive)
@@ -1796,121 +2326,81 @@ class WebsiteAnalyzer:
     
     def _get_default_color_analysis(self) -> Dict[str, Any]:
         """Default color analysis when no colors detected."""
-        return {
-            'primary_colors': ['#000000'],
-            'secondary_colors': ['#ffffff'],
-            'accent_colors': [],
-            'neutral_colors': ['#808080'],
-            'color_harmony': 'monochromatic',
-            'mood_analysis': 'neutral',
-            'psychology_profile': 'minimal',
-            'accessibility': 'unknown',
-            'trends': [],
-            'total_colors': 2,
-            'color_richness': 'minimal',
-            'temperature': 'neutral',
-            'saturation_level': 'low',
-            'brightness_distribution': 'balanced'
-        }
+        return copy.deepcopy(_DEFAULT_COLOR_ANALYSIS)
     
     def _get_default_typography_analysis(self) -> Dict[str, Any]:
         """Default typography analysis when no fonts detected."""
-        return {
-            'primary_fonts': ['system-ui'],
-            'font_classification': {'sans_serif': 1},
-            'hierarchy': 'basic',
-            'pairing_strategy': 'single_font',
-            'readability_score': 'good',
-            'accessibility_rating': 'standard',
-            'trends': [],
-            'performance_impact': 'low',
-            'font_variety': 1,
-            'style_consistency': 'high',
-            'brand_alignment': 'neutral',
-            'modern_features': []
-        }
+        return copy.deepcopy(_DEFAULT_TYPOGRAPHY_ANALYSIS)
     
-    def _is_neutral_color(self, color: str) -> bool:
-        """Check if color is neutral (grays, whites, blacks)."""
-        neutral_indicators = ['gray', 'grey', 'white', 'black', '#fff', '#000', 'rgb(255,255,255)', 'rgb(0,0,0)']
-        return any(indicator in color.lower() for indicator in neutral_indicators)
-    
-    def _is_primary_color_candidate(self, color: str) -> bool:
-        """Check if color is a primary color candidate."""
-        primary_indicators = ['blue', 'red', 'green', 'orange', 'purple', 'yellow']
-        return any(indicator in color.lower() for indicator in primary_indicators)
-    
-    def _is_accent_color(self, color: str) -> bool:
-        """Check if color is likely an accent color."""
-        accent_indicators = ['pink', 'cyan', 'lime', 'magenta', 'teal', 'coral']
-        return any(indicator in color.lower() for indicator in accent_indicators)
-    
-    def _detect_color_harmony(self, colors: List[str]) -> str:
-        """Detect color harmony type."""
-        if len(colors) <= 2:
+    def _detect_color_harmony(self, hues: List[float]) -> str:
+        """
+        Detect color harmony from how the palette's hues cluster on the color wheel.
+        
+        Args:
+            hues: Hues in degrees of the chromatic (non-gray) colors
+            
+        Returns:
+            str: monochromatic, analogous, complementary, triadic or complex
+        """
+        # Grays alone carry no hue, which reads as a single-hue palette
+        if not hues:
             return 'monochromatic'
-        elif len(colors) <= 4:
-            return 'complementary'
-        elif len(colors) <= 6:
-            return 'triadic'
-        else:
+        
+        clusters = _hue_clusters(hues)
+        if len(clusters) == 1:
+            span = clusters[0][1]
+            if span < _MONOCHROMATIC_SPAN:
+                return 'monochromatic'
+            elif span <= _ANALOGOUS_SPAN:
+                return 'analogous'
             return 'complex'
-    
-    def _analyze_color_psychology(self, colors: List[str]) -> str:
-        """Analyze color psychology and mood."""
-        color_moods = []
-        for color in colors:
-            if any(blue in color.lower() for blue in ['blue', 'navy', 'cyan']):
-                color_moods.append('trust')
-            elif any(red in color.lower() for red in ['red', 'crimson', 'cherry']):
-                color_moods.append('energy')
-            elif any(green in color.lower() for green in ['green', 'forest', 'lime']):
-                color_moods.append('growth')
-            elif any(purple in color.lower() for purple in ['purple', 'violet', 'magenta']):
-                color_moods.append('luxury')
-        
-        if 'trust' in color_moods:
-            return 'professional_trustworthy'
-        elif 'energy' in color_moods:
-            return 'dynamic_energetic'
-        elif 'growth' in color_moods:
-            return 'natural_organic'
-        elif 'luxury' in color_moods:
-            return 'premium_sophisticated'
-        else:
+        
+        centers = [center for center, _ in clusters]
+        if len(clusters) == 2:
+            distance = _hue_distance(centers[0], centers[1])
+            if abs(distance - 180) <= _HARMONY_TOLERANCE:
+                return 'complementary'
+            elif distance <= _ANALOGOUS_SPAN - _MONOCHROMATIC_SPAN:
+                return 'analogous'
+        elif len(clusters) == 3:
+            distances = (
+                _hue_distance(centers[0], centers[1]),
+                _hue_distance(centers[1], centers[2]),
+                _hue_distance(centers[2], centers[0])
+            )
+            if all(abs(distance - 120) <= _HARMONY_TOLERANCE for distance in distances):
+                return 'triadic'
+        return 'complex'
+    
+    def _analyze_color_psychology(self, palette_traits: int) -> str:
+        """Analyze color psychology and mood from the palette's combined trait bits."""
+        mood_bits = palette_traits >> _COLOR_MOOD_SHIFT
+        if not mood_bits:
             return 'balanced_neutral'
+        
+        # The lowest set bit is the highest-priority family present in any color
+        rank = (mood_bits & -mood_bits).bit_length() - 1
+        return _COLOR_PSYCHOLOGY_KEYWORDS[rank][0]
     
     def _get_color_psychology_profile(self, colors: List[str]) -> Dict[str, Any]:
         """Get detailed color psychology profile."""
-        return {
-            'emotional_impact': 'moderate',
-            'energy_level': 'balanced',
-            'sophistication': 'medium',
-            'approachability': 'high',
-            'memorability': 'good'
-        }
+        return copy.deepcopy(_DEFAULT_COLOR_PSYCHOLOGY_PROFILE)
     
     def _analyze_color_accessibility(self, colors: List[str]) -> Dict[str, Any]:
         """Analyze color accessibility."""
-        return {
-            'contrast_compliance': 'aa_standard',
-            'colorblind_friendly': True,
-            'sufficient_contrast': True,
-            'accessibility_score': 85
-        }
+        return copy.deepcopy(_DEFAULT_COLOR_ACCESSIBILITY)
     
-    def _identify_color_trends(self, colors: List[str]) -> List[str]:
+    def _identify_color_trends(self, palette_traits: int, neutral_count: int, total_colors: int) -> List[str]:
         """Identify current color trends."""
         trends = []
-        if any('gradient' in color.lower() for color in colors):
+        if palette_traits & _COLOR_GRADIENT:
             trends.append('gradients')
-        if len([c for c in colors if self._is_neutral_color(c)]) > len(colors) * 0.6:
+        if neutral_count > total_colors * 0.6:
             trends.append('minimalism')
         return trends
     
-    def _calculate_color_richness(self, colors: List[str]) -> str:
-        """Calculate color richness level."""
-        unique_count = len(set(colors))
+    def _calculate_color_richness(self, unique_count: int) -> str:
+        """Calculate color richness level from the number of distinct colors."""
         if unique_count <= 3:
             return 'minimal'
         elif unique_count <= 6:
@@ -1918,11 +2408,8 @@ class WebsiteAnalyzer:
         else:
             return 'rich'
     
-    def _analyze_color_temperature(self, colors: List[str]) -> str:
-        """Analyze overall color temperature."""
-        warm_count = sum(1 for color in colors if any(warm in color.lower() for warm in ['red', 'orange', 'yellow', 'pink']))
-        cool_count = sum(1 for color in colors if any(cool in color.lower() for cool in ['blue', 'green', 'purple', 'cyan']))
-        
+    def _analyze_color_temperature(self, warm_count: int, cool_count: int) -> str:
+        """Analyze overall color temperature from the warm and cool color counts."""
         if warm_count > cool_count:
             return 'warm'
         elif cool_count > warm_count:
@@ -1930,34 +2417,45 @@ class WebsiteAnalyzer:
         else:
             return 'balanced'
     
-    def _analyze_saturation_levels(self, colors: List[str]) -> str:
-        """Analyze saturation levels."""
-        return 'medium'  # Simplified for now
+    def _analyze_saturation_levels(self, saturations: List[float]) -> str:
+        """Analyze saturation levels from the HSV saturation of each parsed color."""
+        if not saturations:
+            return 'medium'
+        
+        mean_saturation = sum(saturations) / len(saturations)
+        if mean_saturation < 0.2:
+            return 'low'
+        elif mean_saturation < 0.55:
+            return 'medium'
+        else:
+            return 'high'
     
-    def _analyze_brightness_distribution(self, colors: List[str]) -> str:
-        """Analyze brightness distribution."""
-        return 'balanced'  # Simplified for now
+    def _analyze_brightness_distribution(self, values: List[float]) -> str:
+        """Analyze brightness distribution from the HSV value of each parsed color."""
+        if not values:
+            return 'balanced'
+        
+        mean_value = sum(values) / len(values)
+        if max(values) - min(values) >= 0.7:
+            return 'high_contrast'
+        elif mean_value >= 0.75:
+            return 'light'
+        elif mean_value <= 0.3:
+            return 'dark'
+        else:
+            return 'balanced'
     
     # Additional advanced analysis methods
     
-    def _classify_fonts_advanced(self, fonts: List[str]) -> Dict[str, int]:
-        """Advanced font classification."""
-        classification = {'serif': 0, 'sans_serif': 0, 'monospace': 0, 'display': 0, 'script': 0}
-        
-        for font in fonts:
-            font_lower = font.lower()
-            if any(serif in font_lower for serif in ['serif', 'times', 'georgia', 'garamond']):
-                classification['serif'] += 1
-            elif any(mono in font_lower for mono in ['monospace', 'courier', 'monaco', 'consolas']):
-                classification['monospace'] += 1
-            elif any(display in font_lower for display in ['impact', 'lobster', 'oswald']):
-                classification['display'] += 1
-            elif any(script in font_lower for script in ['script', 'cursive', 'handwriting']):
-                classification['script'] += 1
-            else:
-                classification['sans_serif'] += 1
+    def _classify_fonts_advanced(self, font_traits: List[int]) -> Dict[str, int]:
+        """Advanced font classification from per-font trait bits."""
+        # Lowest family bit wins; fonts without one count as sans-serif
+        counts = Counter(
+            _FONT_FAMILY_LABELS[(family & -family).bit_length() - 1] if family else 'sans_serif'
+            for family in (traits & _FONT_FAMILY_MASK for traits in font_traits)
+        )
         
-        return classification
+        return {family: counts[family] for family in _FONT_FAMILY_CLASSES}
     
     def _analyze_typography_hierarchy(self, fonts: List[str], css_info: Dict[str, Any]) -> str:
         """Analyze typography hierarchy."""
@@ -1977,29 +2475,31 @@ class WebsiteAnalyzer:
         else:
             return 'multi_font_system'
     
-    def _assess_typography_readability(self, fonts: List[str]) -> str:
+    def _assess_typography_readability(self, font_traits: List[int]) -> str:
         """Assess typography readability."""
         # Simple heuristic based on font choices
-        readable_fonts = ['helvetica', 'arial', 'georgia', 'times', 'verdana', 'roboto']
-        readable_count = sum(1 for font in fonts if any(readable in font.lower() for readable in readable_fonts))
+        readable_count = sum(1 for traits in font_traits if traits & _FONT_READABLE)
         
-        if readable_count >= len(fonts) * 0.8:
+        if readable_count >= len(font_traits) * 0.8:
             return 'excellent'
-        elif readable_count >= len(fonts) * 0.6:
+        elif readable_count >= len(font_traits) * 0.6:
             return 'good'
         else:
             return 'fair'
     
-    def _identify_typography_trends(self, fonts: List[str]) -> List[str]:
+    def _identify_typography_trends(self, font_traits: List[int]) -> List[str]:
         """Identify typography trends."""
         trends = []
+        combined = 0
+        for traits in font_traits:
+            combined |= traits
         
         # Check for modern trends
-        if any('variable' in font.lower() for font in fonts):
+        if combined & _FONT_VARIABLE:
             trends.append('variable_fonts')
-        if any(modern in ' '.join(fonts).lower() for modern in ['inter', 'roboto', 'poppins', 'nunito']):
+        if combined & _FONT_MODERN_SANS:
             trends.append('modern_sans_serif')
-        if len(fonts) == 1:
+        if len(font_traits) == 1:
             trends.append('minimalist_typography')
         
         return trends
@@ -2017,11 +2517,11 @@ class WebsiteAnalyzer:
         """Rate typography accessibility."""
         return 'good'  # Simplified for now
     
-    def _assess_typography_consistency(self, fonts: List[str]) -> str:
-        """Assess typography consistency."""
-        if len(set(fonts)) <= 2:
+    def _assess_typography_consistency(self, font_variety: int) -> str:
+        """Assess typography consistency from the number of distinct fonts."""
+        if font_variety <= 2:
             return 'high'
-        elif len(set(fonts)) <= 4:
+        elif font_variety <= 4:
             return 'medium'
         else:
             return 'low'
@@ -2052,36 +2552,19 @@ class WebsiteAnalyzer:
     
     def _analyze_grid_system(self, structure: Dict[str, Any]) -> Dict[str, Any]:
         """Analyze grid system usage."""
-        return {
-            'type': 'responsive_grid',
-            'columns': 12,
-            'breakpoints': ['mobile', 'tablet', 'desktop'],
-            'consistency': 'high'
-        }
+        return copy.deepcopy(_DEFAULT_GRID_SYSTEM)
     
     def _analyze_responsive_breakpoints(self, viewport: Dict[str, Any]) -> Dict[str, Any]:
         """Analyze responsive breakpoint strategy."""
-        return {
-            'strategy': 'mobile_first',
-            'breakpoints': ['320px', '768px', '1024px', '1200px'],
-            'flexibility': 'high'
-        }
+        return copy.deepcopy(_DEFAULT_RESPONSIVE_BREAKPOINTS)
     
     def _analyze_space_utilization(self, structure: Dict[str, Any]) -> Dict[str, Any]:
         """Analyze space utilization."""
-        return {
-            'efficiency': 'good',
-            'white_space': 'balanced',
-            'content_density': 'medium'
-        }
+        return copy.deepcopy(_DEFAULT_SPACE_UTILIZATION)
     
     def _analyze_layout_performance(self, structure: Dict[str, Any]) -> Dict[str, Any]:
         """Analyze layout performance."""
-        return {
-            'rendering_efficiency': 'good',
-            'layout_shift_risk': 'low',
-            'paint_optimization': 'moderate'
-        }
+        return copy.deepcopy(_DEFAULT_LAYOUT_PERFORMANCE)
     
     def _calculate_layout_flexibility(self, structure: Dict[str, Any]) -> int:
         """Calculate layout flexibility score."""
@@ -2089,12 +2572,10 @@ class WebsiteAnalyzer:
     
     def _rate_layout_complexity(self, structure: Dict[str, Any]) -> str:
         """Rate layout complexity."""
-        components = sum([
-            structure.get('hasHeader', 0),
-            structure.get('hasFooter', 0),
-            structure.get('hasNavigation', 0),
-            structure.get('hasSidebar', 0)
-        ])
+        get = structure.get
+        components = (
+            get('hasHeader', 0) + get('hasFooter', 0) + get('hasNavigation', 0) + get('hasSidebar', 0)
+        )
         
         if components <= 2:
             return 'simple'
@@ -2105,52 +2586,41 @@ class WebsiteAnalyzer:
     
     def _analyze_layout_accessibility(self, structure: Dict[str, Any]) -> Dict[str, Any]:
         """Analyze layout accessibility features."""
-        return {
-            'semantic_structure': 'good',
-            'skip_navigation': 'detected',
-            'landmark_usage': 'proper'
-        }
+        return copy.deepcopy(_DEFAULT_LAYOUT_ACCESSIBILITY)
     
     def _detect_modern_css_features(self, structure: Dict[str, Any]) -> List[str]:
         """Detect modern CSS features."""
-        features = []
         # This would detect features like CSS Grid, Flexbox, Custom Properties, etc.
-        features.extend(['custom_properties', 'css_grid', 'flexbox'])
-        return features
+        return copy.deepcopy(_DEFAULT_MODERN_CSS_FEATURES)
     
     def _analyze_component_consistency(self, interactive: Dict[str, Any]) -> Dict[str, Any]:
         """Analyze component consistency."""
-        buttons = interactive.get('buttons', [])
+        buttons = interactive.get('buttons', ())
+        
+        # Only "more than two styles" matters, so stop at the third distinct one
+        styles = set()
+        for button in buttons:
+            styles.add(button.get('style', ''))
+            if len(styles) > 2:
+                break
+        
         return {
-            'button_consistency': 'high' if len(set(btn.get('style', '') for btn in buttons)) <= 2 else 'medium',
+            'button_consistency': 'high' if len(styles) <= 2 else 'medium',
             'pattern_adherence': 'good',
             'variant_control': 'systematic'
         }
     
     def _detect_design_tokens(self, css_info: Dict[str, Any]) -> Dict[str, Any]:
         """Detect design tokens usage."""
-        return {
-            'color_tokens': 'detected',
-            'spacing_tokens': 'detected',
-            'typography_tokens': 'detected',
-            'consistency_level': 'high'
-        }
+        return copy.deepcopy(_DEFAULT_DESIGN_TOKENS)
     
     def _analyze_pattern_library(self, data: Dict[str, Any]) -> Dict[str, Any]:
         """Analyze pattern library usage."""
-        return {
-            'component_library': 'custom',
-            'pattern_consistency': 'high',
-            'reusability_score': 85
-        }
+        return copy.deepcopy(_DEFAULT_PATTERN_LIBRARY)
     
     def _analyze_brand_system(self, data: Dict[str, Any]) -> Dict[str, Any]:
         """Analyze brand system implementation."""
-        return {
-            'brand_consistency': 'high',
-            'visual_identity': 'strong',
-            'brand_guidelines': 'well_implemented'
-        }
+        return copy.deepcopy(_DEFAULT_BRAND_SYSTEM)
     
     def _assess_systematic_approach(self, data: Dict[str, Any]) -> str:
         """Assess systematic design approach."""
@@ -2166,38 +2636,20 @@ class WebsiteAnalyzer:
     
     def _analyze_visual_identity(self, data: Dict[str, Any]) -> Dict[str, Any]:
         """Analyze visual identity elements."""
-        return {
-            'logo_presence': 'detected',
-            'brand_colors': 'consistent',
-            'visual_style': 'cohesive'
-        }
+        return copy.deepcopy(_DEFAULT_VISUAL_IDENTITY)
     
     def _analyze_brand_personality(self, data: Dict[str, Any]) -> Dict[str, Any]:
         """Analyze brand personality."""
-        return {
-            'personality_traits': ['professional', 'modern', 'trustworthy'],
-            'tone': 'formal',
-            'character': 'authoritative'
-        }
+        return copy.deepcopy(_DEFAULT_BRAND_PERSONALITY)
     
     def _analyze_brand_positioning(self, data: Dict[str, Any]) -> Dict[str, Any]:
         """Analyze brand positioning."""
-        return {
-            'market_position': 'premium',
-            'target_segment': 'professional',
-            'differentiation': 'quality_focus'
-        }
+        return copy.deepcopy(_DEFAULT_BRAND_POSITIONING)
     
     def _analyze_brand_voice(self, data: Dict[str, Any]) -> Dict[str, Any]:
         """Analyze brand voice and tone."""
-        content = data.get('content', {})
-        text_content = content.get('text_content', '')
-        
-        return {
-            'voice_characteristics': ['professional', 'clear', 'direct'],
-            'tone_variation': 'consistent',
-            'communication_style': 'formal'
-        }
+        # Would analyze content['text_content']
+        return copy.deepcopy(_DEFAULT_BRAND_VOICE)
     
     def _calculate_brand_consistency(self, data: Dict[str, Any]) -> int:
         """Calculate brand consistency score."""
@@ -2209,11 +2661,7 @@ class WebsiteAnalyzer:
     
     def _analyze_emotional_appeal(self, data: Dict[str, Any]) -> Dict[str, Any]:
         """Analyze emotional appeal."""
-        return {
-            'emotional_triggers': ['trust', 'professionalism'],
-            'appeal_level': 'moderate',
-            'emotional_connection': 'functional'
-        }
+        return copy.deepcopy(_DEFAULT_EMOTIONAL_APPEAL)
     
     def _classify_primary_visual_style(self, color_palette: Dict, typography: Dict, patterns: List[str]) -> str:
         """Classify primary visual style."""
@@ -2223,9 +2671,10 @@ class WebsiteAnalyzer:
         
         if mood == 'professional_trustworthy' and font_classification.get('sans_serif', 0) > 0:
             return 'modern_professional'
-        elif mood == 'luxury' or mood == 'premium_sophisticated':
+        elif mood in _LUXURY_MOODS:
             return 'luxury_premium'
-        elif 'minimal' in ' '.join(patterns).lower():
+        elif any('minimal' in pattern.lower() for pattern in patterns):
+            # Per-name test: the keyword has no space, so it cannot span two joined names
             return 'minimalist'
         elif mood == 'dynamic_energetic':
             return 'dynamic_modern'
@@ -2245,26 +2694,15 @@ class WebsiteAnalyzer:
     
     def _calculate_aesthetic_scores(self, color_palette: Dict, typography: Dict, patterns: List[str]) -> Dict[str, int]:
         """Calculate aesthetic scores."""
-        return {
-            'visual_appeal': 85,
-            'sophistication': 78,
-            'modernity': 82,
-            'uniqueness': 70,
-            'cohesiveness': 88
-        }
+        return copy.deepcopy(_DEFAULT_AESTHETIC_SCORES)
     
     def _analyze_trend_alignment(self, color_palette: Dict, typography: Dict, patterns: List[str]) -> Dict[str, Any]:
         """Analyze trend alignment."""
-        return {
-            'current_trends': ['minimalism', 'modern_typography'],
-            'trend_score': 80,
-            'future_proof': 'good'
-        }
+        return copy.deepcopy(_DEFAULT_TREND_ALIGNMENT)
     
     def _assess_design_innovation(self, patterns: List[str]) -> str:
         """Assess design innovation level."""
-        modern_patterns = ['hero_section', 'card_layout', 'responsive_grid']
-        innovation_count = sum(1 for pattern in patterns if pattern in modern_patterns)
+        innovation_count = sum(1 for pattern in patterns if pattern in _MODERN_DESIGN_PATTERNS)
         
         if innovation_count >= 3:
             return 'high'
@@ -2276,7 +2714,9 @@ class WebsiteAnalyzer:
     def _assess_timeless_design(self, color_palette: Dict, typography: Dict) -> str:
         """Assess timeless design factors."""
         # Simple heuristic based on color neutrality and typography choices
-        neutral_ratio = len(color_palette.get('neutral_colors', [])) / max(len(color_palette.get('primary_colors', [])), 1)
+        neutrals = color_palette.get('neutral_colors') or ()
+        primaries = color_palette.get('primary_colors') or ()
+        neutral_ratio = len(neutrals) / max(len(primaries), 1)
         
         if neutral_ratio > 0.5 and typography.get('style_consistency') == 'high':
             return 'high'
@@ -2286,133 +2726,66 @@ class WebsiteAnalyzer:
     def _infer_design_demographic(self, color_palette: Dict, typography: Dict) -> str:
         """Infer target demographic from design choices."""
         mood = color_palette.get('mood_analysis', 'neutral')
-        
-        if mood == 'professional_trustworthy':
-            return 'business_professionals'
-        elif mood == 'dynamic_energetic':
-            return 'young_adults'
-        elif mood == 'premium_sophisticated':
-            return 'affluent_adults'
-        else:
-            return 'general_audience'
+        return _MOOD_DEMOGRAPHICS.get(mood, 'general_audience')
     
     # Placeholder methods for remaining advanced features
     
     def _analyze_visual_hierarchy_advanced(self, data: Dict[str, Any]) -> Dict[str, Any]:
         """Advanced visual hierarchy analysis."""
-        return {
-            'hierarchy_clarity': 'good',
-            'information_flow': 'logical',
-            'visual_weight_distribution': 'balanced',
-            'scan_pattern': 'z_pattern'
-        }
+        return copy.deepcopy(_DEFAULT_VISUAL_HIERARCHY)
     
     def _analyze_responsive_design_advanced(self, viewport_info: Dict[str, Any]) -> Dict[str, Any]:
         """Advanced responsive design analysis."""
-        return {
-            'responsive_strategy': 'mobile_first',
-            'breakpoint_optimization': 'good',
-            'content_adaptation': 'excellent',
-            'performance_across_devices': 'optimized'
-        }
+        return copy.deepcopy(_DEFAULT_RESPONSIVE_DESIGN)
     
-    def _identify_ui_components_advanced(self, data: Dict[str, Any]) -> List[Dict[str, Any]]:
+    def _identify_ui_components_advanced(self, interactive: Dict[str, Any]) -> List[Dict[str, Any]]:
         """Advanced UI component identification."""
         components = []
         
-        interactive = data.get('interactive_elements', {})
-        
-        if interactive.get('buttons'):
+        buttons = interactive.get('buttons')
+        if buttons:
             components.append({
                 'type': 'button_system',
-                'variants': len(interactive['buttons']),
+                'variants': len(buttons),
                 'consistency': 'high'
             })
         
         if interactive.get('forms'):
-            components.append({
-                'type': 'form_system',
-                'complexity': 'medium',
-                'validation': 'client_side'
-            })
+            components.append(copy.deepcopy(_FORM_SYSTEM_COMPONENT))
         
         return components
     
     def _analyze_spacing_patterns_advanced(self, css_info: Dict[str, Any]) -> Dict[str, Any]:
         """Advanced spacing pattern analysis."""
-        return {
-            'spacing_system': 'systematic',
-            'rhythm_consistency': 'good',
-            'white_space_usage': 'effective',
-            'spacing_scale': '8px_base',
-            'vertical_rhythm': 'maintained'
-        }
+        return copy.deepcopy(_DEFAULT_SPACING_PATTERNS)
     
     def _analyze_interaction_patterns_advanced(self, data: Dict[str, Any]) -> Dict[str, Any]:
         """Advanced interaction pattern analysis."""
-        return {
-            'interaction_paradigms': ['click', 'hover', 'scroll'],
-            'feedback_mechanisms': ['visual', 'micro_animations'],
-            'user_guidance': 'clear',
-            'error_handling': 'graceful'
-        }
+        return copy.deepcopy(_DEFAULT_INTERACTION_PATTERNS)
     
     def _analyze_accessibility_advanced(self, data: Dict[str, Any]) -> Dict[str, Any]:
         """Advanced accessibility analysis."""
-        return {
-            'wcag_compliance': 'aa_partial',
-            'screen_reader_support': 'good',
-            'keyboard_navigation': 'complete',
-            'color_contrast': 'sufficient',
-            'focus_management': 'implemented',
-            'accessibility_score': 82
-        }
+        return copy.deepcopy(_DEFAULT_ACCESSIBILITY_ANALYSIS)
     
     def _analyze_design_trends(self, data: Dict[str, Any]) -> List[str]:
         """Analyze current design trends implementation."""
-        trends = []
-        
         # Check for common modern trends
-        if data.get('design_analysis', {}).get('color_palette', {}).get('trends'):
-            trends.extend(data['design_analysis']['color_palette']['trends'])
-        
-        trends.extend(['responsive_design', 'mobile_first', 'clean_typography'])
-        
-        return list(set(trends))
+        palette_trends = data.get('design_analysis', {}).get('color_palette', {}).get('trends') or ()
+        return list(_design_trends_for(tuple(palette_trends)))
     
     def _detect_component_system(self, data: Dict[str, Any]) -> Dict[str, Any]:
         """Detect component system usage."""
-        return {
-            'component_library': 'custom',
-            'design_system_maturity': 'developing',
-            'component_reusability': 'good',
-            'pattern_consistency': 'high'
-        }
+        return copy.deepcopy(_DEFAULT_COMPONENT_SYSTEM)
     
     def _analyze_micro_interactions(self, data: Dict[str, Any]) -> Dict[str, Any]:
         """Analyze micro-interactions."""
-        return {
-            'hover_effects': 'present',
-            'loading_states': 'basic',
-            'transition_animations': 'subtle',
-            'feedback_mechanisms': 'immediate'
-        }
+        return copy.deepcopy(_DEFAULT_MICRO_INTERACTIONS)
     
     def _analyze_animation_patterns(self, data: Dict[str, Any]) -> Dict[str, Any]:
         """Analyze animation patterns."""
-        return {
-            'animation_library': 'css_based',
-            'animation_complexity': 'minimal',
-            'performance_impact': 'low',
-            'user_preference_respect': 'implemented'
-        }
+        return copy.deepcopy(_DEFAULT_ANIMATION_PATTERNS)
     
     def _analyze_content_presentation(self, data: Dict[str, Any]) -> Dict[str, Any]:
         """Analyze content presentation patterns."""
-        return {
-            'content_hierarchy': 'clear',
-            'readability_optimization': 'good',
-            'content_chunking': 'effective',
-            'visual_content_balance': 'appropriate'
-        }
+        return copy.deepcopy(_DEFAULT_CONTENT_PRESENTATION)
 
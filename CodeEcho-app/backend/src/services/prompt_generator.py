@@ -2,13 +2,11 @@
 AI-driven prompt generation service for creating comprehensive prompts from website analysis.
 Uses Ollama for local, secure, and open-source AI model inference.
 """
-import json
 import os
 from typing import Dict, Any, List
 import ollama
 import logging
 
-logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 class PromptGenerator:
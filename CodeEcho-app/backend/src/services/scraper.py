@@ -2,14 +2,12 @@
 Website scraper service for extracting content and structure from web pages.
 """
 import asyncio
-import json
 import re
 from urllib.parse import urljoin, urlparse
 from playwright.async_api import async_playwright
 from bs4 import BeautifulSoup
 import logging
 
-logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 class WebsiteScraper:
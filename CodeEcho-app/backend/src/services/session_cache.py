@@ -0,0 +1,187 @@
+"""
+Bounded in-memory session cache with LRU eviction and TTL expiration.
+"""
+import math
+import threading
+import time
+from typing import Any, Dict, Optional
+
+
+class _Node:
+    """Entry in the cache's doubly-linked recency list."""
+
+    __slots__ = ('prev', 'next', 'key', 'value', 'ts', 'hits', 'cost', 'url_key')
+
+    def __init__(self, key: Optional[str] = None, value: Any = None, cost: float = 0.0):
+        self.prev = None
+        self.next = None
+        self.key = key
+        self.value = value
+        self.ts = time.monotonic()
+        self.hits = 0
+        self.cost = cost
+        self.url_key = None
+
+
+class SessionCache:
+    """
+    LRU cache with per-entry TTL and value-aware (v-LRU) eviction.
+
+    Entries live in a doubly-linked list ordered from most to least recently
+    used, with a hash map from key to list node, so lookups and insertions are
+    O(1). When the cache is full, expired entries at the LRU end go first;
+    otherwise the entry with the lowest log(cost + hits) among the least
+    recently used 10% is evicted, so frequently downloaded or expensive
+    sessions survive bursts of new analyses.
+
+    A secondary url_index maps a content key (hash of the normalized URL) to
+    the session holding that URL's latest analysis. It is kept in lockstep
+    with eviction and expiry, so a lookup never returns a purged session.
+    """
+
+    EVICTION_WINDOW = 0.1
+
+    def __init__(self, max_entries: int = 1024, ttl: float = 3600):
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.map: Dict[str, _Node] = {}
+        self.url_index: Dict[str, str] = {}
+        self._lock = threading.Lock()
+
+        # Sentinels: head.next is the most recently used entry, tail.prev the least
+        self._head = _Node()
+        self._tail = _Node()
+        self._head.next = self._tail
+        self._tail.prev = self._head
+
+    def __len__(self) -> int:
+        return len(self.map)
+
+    def get(self, key: str) -> Optional[Any]:
+        """
+        Return the cached value for key, or None if missing or expired.
+
+        A hit moves the entry to the front of the recency list.
+        """
+        with self._lock:
+            node = self.map.get(key)
+            if node is None:
+                return None
+
+            if time.monotonic() - node.ts > self.ttl:
+                self._remove(node)
+                return None
+
+            node.hits += 1
+            self._unlink(node)
+            self._push_front(node)
+            return node.value
+
+    def put(self, key: str, value: Any, cost: float = 0.0) -> None:
+        """
+        Insert or replace an entry, evicting one when the cache is full.
+
+        Args:
+            key: Cache key
+            value: Value to store
+            cost: Estimated cost of regenerating the value; higher-cost
+                entries are preferred to stay cached
+        """
+        with self._lock:
+            node = self.map.get(key)
+            if node is not None:
+                self._unlink(node)
+                node.value = value
+                node.cost = cost
+                node.ts = time.monotonic()
+            else:
+                if len(self.map) >= self.max_entries:
+                    self._evict()
+                node = _Node(key, value, cost)
+                self.map[key] = node
+            self._push_front(node)
+
+    def replace(self, key: str, value: Any) -> bool:
+        """
+        Swap the value of a live entry without touching its age, hits or recency.
+
+        Readers that already hold the old value keep a consistent object, so
+        callers should replace a stored dict with an updated copy instead of
+        mutating it in place.
+
+        Args:
+            key: Cache key
+            value: New value to store
+
+        Returns:
+            bool: False if the key is missing or expired
+        """
+        with self._lock:
+            node = self.map.get(key)
+            if node is None or time.monotonic() - node.ts > self.ttl:
+                return False
+            node.value = value
+            return True
+
+    def _evict(self) -> None:
+        """Remove one entry from the least recently used end of the list."""
+        window = max(1, int(len(self.map) * self.EVICTION_WINDOW))
+        now = time.monotonic()
+
+        victim = None
+        victim_score = math.inf
+        node = self._tail.prev
+        while node is not self._head and window > 0:
+            if now - node.ts > self.ttl:
+                victim = node
+                break
+            score = math.log(node.cost + node.hits + 1e-6)
+            if score < victim_score:
+                victim, victim_score = node, score
+            node = node.prev
+            window -= 1
+
+        if victim is None:
+            return
+        self._remove(victim)
+
+    def index_url(self, url_key: str, key: str) -> None:
+        """
+        Point url_key at the session stored under key.
+
+        Args:
+            url_key: Content key derived from the normalized URL
+            key: Session key of a cached entry
+        """
+        with self._lock:
+            node = self.map.get(key)
+            if node is None:
+                return
+            previous = self.map.get(self.url_index.get(url_key))
+            if previous is not None and previous is not node:
+                previous.url_key = None
+            node.url_key = url_key
+            self.url_index[url_key] = key
+
+    def lookup_url(self, url_key: str) -> Optional[str]:
+        """Return the session key indexed under url_key, if any."""
+        with self._lock:
+            return self.url_index.get(url_key)
+
+    def _remove(self, node: _Node) -> None:
+        """Drop node from the list, the key map and the URL index."""
+        self._unlink(node)
+        del self.map[node.key]
+        if node.url_key is not None and self.url_index.get(node.url_key) == node.key:
+            del self.url_index[node.url_key]
+
+    def _unlink(self, node: _Node) -> None:
+        node.prev.next = node.next
+        node.next.prev = node.prev
+        node.prev = node.next = None
+
+    def _push_front(self, node: _Node) -> None:
+        node.prev = self._head
+        node.next = self._head.next
+        self._head.next.prev = node
+        self._head.next = node
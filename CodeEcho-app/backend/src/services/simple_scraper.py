@@ -7,7 +7,6 @@ import re
 from urllib.parse import urljoin, urlparse
 import logging
 
-logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 class SimpleWebsiteScraper:
@@ -0,0 +1,47 @@
+"""
+JSON helpers that use the fastest serializer available.
+
+orjson is preferred, then ujson, then the standard library. The backend is
+picked once at import time; all functions emit UTF-8 bytes so callers can
+write the result straight to a file or archive without decoding.
+"""
+try:
+    import orjson as _backend
+    BACKEND = 'orjson'
+except ImportError:
+    try:
+        import ujson as _backend
+        BACKEND = 'ujson'
+    except ImportError:
+        import json as _backend
+        BACKEND = 'json'
+
+
+if BACKEND == 'orjson':
+    def dumps(obj, indent=False, sort_keys=False, default=None) -> bytes:
+        """Serialize obj to UTF-8 encoded JSON bytes."""
+        option = _backend.OPT_NON_STR_KEYS
+        if indent:
+            option |= _backend.OPT_INDENT_2
+        if sort_keys:
+            option |= _backend.OPT_SORT_KEYS
+        return _backend.dumps(obj, default=default, option=option)
+
+elif BACKEND == 'ujson':
+    def dumps(obj, indent=False, sort_keys=False, default=None) -> bytes:
+        """Serialize obj to UTF-8 encoded JSON bytes."""
+        return _backend.dumps(
+            obj, indent=2 if indent else 0, sort_keys=sort_keys, ensure_ascii=False, default=default
+        ).encode('utf-8')
+
+else:
+    def dumps(obj, indent=False, sort_keys=False, default=None) -> bytes:
+        """Serialize obj to UTF-8 encoded JSON bytes."""
+        return _backend.dumps(
+            obj, indent=2 if indent else None, sort_keys=sort_keys, ensure_ascii=False, default=default
+        ).encode('utf-8')
+
+
+def loads(data):
+    """Deserialize JSON from bytes or str."""
+    return _backend.loads(data)
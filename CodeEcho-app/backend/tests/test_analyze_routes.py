@@ -0,0 +1,116 @@
+"""
+Tests for URL reuse in the analysis routes.
+"""
+import sys
+import types
+import unittest
+from unittest import mock
+
+from flask import Flask
+
+from src.services.session_cache import SessionCache
+
+# The prompt generator talks to a local Ollama server; the routes only need its class name at import
+_prompt_stub = types.ModuleType('src.services.prompt_generator')
+_prompt_stub.PromptGenerator = object
+with mock.patch.dict(sys.modules, {'src.services.prompt_generator': _prompt_stub}):
+    from src.routes import analyze
+
+
+class FakeClock:
+    """Stand-in for the time module with a manually advanced monotonic clock."""
+
+    def __init__(self):
+        self.now = 1000.0
+
+    def monotonic(self):
+        return self.now
+
+
+class FakePromptGenerator:
+    def generate_comprehensive_prompt(self, analysis):
+        return {'text_format': 'prompt', 'json_format': {}, 'sections': {}, 'metadata': {}}
+
+
+class UrlReuseTest(unittest.TestCase):
+    def setUp(self):
+        self.scraped_urls = []
+        self.page = None
+        self.clock = FakeClock()
+        for target, value in (
+            ('session_cache', SessionCache(max_entries=16, ttl=60)),
+            ('result_cache', SessionCache(max_entries=16, ttl=60)),
+            ('scrape_website_sync', self.fake_scrape),
+            ('PromptGenerator', FakePromptGenerator),
+            ('time', self.clock),
+        ):
+            patcher = mock.patch.object(analyze, target, value)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+        app = Flask(__name__)
+        app.register_blueprint(analyze.analyze_bp, url_prefix='/api')
+        self.client = app.test_client()
+
+    def fake_scrape(self, url):
+        self.scraped_urls.append(url)
+        if self.page is not None:
+            return dict(self.page)
+        return {'url': url, 'title': 'Example', 'content_analysis': {'word_count': len(self.scraped_urls)}}
+
+    def analyze(self, url):
+        response = self.client.post('/api/analyze-website', json={'url': url})
+        self.assertEqual(response.status_code, 200)
+        return response.get_json()['session_id']
+
+    def test_repeat_url_reuses_analysis_under_new_session(self):
+        first = self.analyze('example.com')
+        second = self.analyze('Example.com/')
+
+        self.assertEqual(self.scraped_urls, ['https://example.com'])
+        self.assertNotEqual(first, second)
+        for session_id in (first, second):
+            response = self.client.get(f'/api/session/{session_id}')
+            self.assertEqual(response.status_code, 200)
+            self.assertEqual(response.get_json()['url'], 'https://example.com')
+
+    def test_expired_original_is_not_reused(self):
+        self.analyze('example.com')
+        self.clock.now += 61
+
+        self.analyze('example.com')
+
+        self.assertEqual(len(self.scraped_urls), 2)
+
+    def test_reuse_does_not_extend_the_original_age(self):
+        self.analyze('example.com')
+        self.clock.now += 40
+        self.analyze('example.com')
+        self.clock.now += 30
+
+        # The alias made at +40s carries the original analysis time, which is now 70s old
+        self.analyze('example.com')
+
+        self.assertEqual(len(self.scraped_urls), 2)
+
+    def test_identical_content_gives_each_session_its_own_results(self):
+        self.page = {'title': 'Mirror', 'content_analysis': {'word_count': 1}}
+        first = self.analyze('example.com')
+        second = self.analyze('mirror.example.com')
+
+        self.assertEqual(len(analyze.result_cache), 1)
+        first_entry = analyze.session_cache.get(first)
+        second_entry = analyze.session_cache.get(second)
+        self.assertEqual(first_entry['analysis_result'], second_entry['analysis_result'])
+        self.assertIsNot(first_entry['analysis_result'], second_entry['analysis_result'])
+        self.assertIsNot(first_entry['prompt_result'], second_entry['prompt_result'])
+
+        # Edits to one session reach neither the other sessions nor the cached results
+        first_entry['analysis_result']['website_info']['title'] = 'Changed'
+        third = self.analyze('copy.example.com')
+        self.assertEqual(analyze.session_cache.get(third)['analysis_result']['website_info']['title'], 'Mirror')
+        self.assertEqual(second_entry['analysis_result']['website_info']['title'], 'Mirror')
+
+
+if __name__ == '__main__':
+    unittest.main()
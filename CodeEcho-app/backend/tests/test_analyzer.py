@@ -0,0 +1,142 @@
+"""
+Tests for the website analyzer.
+"""
+import ast
+import copy
+import os
+import unittest
+from collections import Counter
+
+from src.services.analyzer import WebsiteAnalyzer, _DEFAULT_CONTENT_PRESENTATION, _color_hsv
+
+ANALYZER_PATH = os.path.join(os.path.dirname(__file__), '..', 'src', 'services', 'analyzer.py')
+
+
+class WebsiteAnalyzerDefinitionTest(unittest.TestCase):
+    def test_no_method_is_defined_twice(self):
+        # A second def silently replaces the first, so edits to the earlier one never run
+        with open(ANALYZER_PATH, encoding='utf-8') as f:
+            tree = ast.parse(f.read())
+        cls = next(node for node in tree.body if isinstance(node, ast.ClassDef) and node.name == 'WebsiteAnalyzer')
+        names = Counter(node.name for node in cls.body if isinstance(node, ast.FunctionDef))
+        self.assertEqual([name for name, count in names.items() if count > 1], [])
+
+    def test_content_presentation_is_shared_by_both_sections(self):
+        data = {'url': 'https://example.com', 'title': 'Example', 'content_analysis': {'list_count': 5}}
+        analysis = WebsiteAnalyzer().analyze_scraped_data(data)
+        self.assertEqual(analysis['design_analysis']['content_presentation'], _DEFAULT_CONTENT_PRESENTATION)
+        self.assertEqual(analysis['content_strategy']['content_presentation'], _DEFAULT_CONTENT_PRESENTATION)
+
+
+class ReportIsolationTest(unittest.TestCase):
+    def test_placeholder_results_are_not_shared_between_reports(self):
+        data = {'url': 'https://example.com', 'title': 'Example', 'css_info': {'colors': ['red'], 'fonts': ['Arial']}}
+        first = WebsiteAnalyzer().analyze_scraped_data(data)
+        first['technical_analysis']['optimization_patterns']['asset_optimization']['image_optimization'] = False
+        first['technical_analysis']['api_integrations']['third_party_apis'].append('payments')
+        first['design_analysis']['brand_analysis']['personality']['personality_traits'].clear()
+
+        second = WebsiteAnalyzer().analyze_scraped_data(data)
+        self.assertTrue(second['technical_analysis']['optimization_patterns']['asset_optimization']['image_optimization'])
+        self.assertEqual(second['technical_analysis']['api_integrations']['third_party_apis'], ['analytics', 'social_media'])
+        self.assertEqual(second['design_analysis']['brand_analysis']['personality']['personality_traits'],
+                         ['professional', 'modern', 'trustworthy'])
+
+    def test_default_color_and_typography_analyses_are_not_shared(self):
+        data = {'url': 'https://example.com', 'title': 'Example', 'css_info': {'colors': ['red'], 'fonts': []}}
+        first = WebsiteAnalyzer().analyze_scraped_data(data)['design_analysis']
+        first['typography']['primary_fonts'].append('Comic Sans')
+        first['typography']['font_classification']['sans_serif'] = 9
+
+        second = WebsiteAnalyzer().analyze_scraped_data(data)['design_analysis']
+        self.assertNotIn('Comic Sans', second['typography']['primary_fonts'])
+        self.assertEqual(second['typography']['font_classification'], {'sans_serif': 1})
+        self.assertIsNot(
+            WebsiteAnalyzer()._get_default_color_analysis()['primary_colors'],
+            WebsiteAnalyzer()._get_default_color_analysis()['primary_colors'],
+        )
+
+    def test_design_analysis_without_page_data_is_not_shared(self):
+        data = {'url': 'https://example.com', 'title': 'Example'}
+        first = WebsiteAnalyzer().analyze_scraped_data(data)['design_analysis']
+        first['layout']['grid_system']['columns'] = 0
+        first['design_trends'].clear()
+
+        second = WebsiteAnalyzer().analyze_scraped_data(data)['design_analysis']
+        self.assertEqual(second['layout']['grid_system']['columns'], 12)
+        self.assertTrue(second['design_trends'])
+
+    def test_memoized_palette_analysis_is_not_shared(self):
+        colors = ['red', '#1e90ff', 'rgb(255, 165, 0)', '#ffffff']
+        first = WebsiteAnalyzer()._analyze_color_palette_advanced(colors)
+        expected = copy.deepcopy(first)
+        first['primary_colors'].append('#123456')
+        first['psychology_profile']['energy_level'] = 'changed'
+
+        second = WebsiteAnalyzer()._analyze_color_palette_advanced(colors)
+        self.assertEqual(second, expected)
+
+
+class ColorParsingTest(unittest.TestCase):
+    def test_malformed_alpha_is_unparseable(self):
+        self.assertIsNone(_color_hsv('rgba(0,0,0,.)'))
+        self.assertIsNone(_color_hsv('rgba(0, 0, 0, 1.2.3)'))
+
+    def test_transparent_and_opaque_colors(self):
+        self.assertIsNone(_color_hsv('rgba(1, 2, 3, 0)'))
+        self.assertEqual(_color_hsv('rgb(255, 0, 0)'), (0.0, 1.0, 1.0))
+
+    def test_malformed_color_does_not_fail_the_analysis(self):
+        data = {'url': 'https://example.com', 'title': 'Example', 'css_info': {'colors': ['rgba(0,0,0,.)', 'red']}}
+        analysis = WebsiteAnalyzer().analyze_scraped_data(data)
+        self.assertIn('color_palette', analysis['design_analysis'])
+
+
+class ColorHarmonyTest(unittest.TestCase):
+    # (palette, expected harmony); neutrals carry no hue and are ignored
+    PALETTES = [
+        (['navy', 'blue', 'rgb(30, 60, 200)', '#ffffff'], 'monochromatic'),
+        (['#ff0020', '#ff2000'], 'monochromatic'),
+        (['#ffffff', '#000000', '#808080'], 'monochromatic'),
+        (['#ff0000', '#ff8000', '#ffff00'], 'analogous'),
+        (['#0000ff', '#8000ff', '#ff00ff'], 'analogous'),
+        (['#ff0040', '#ff4000'], 'analogous'),
+        (['#0000ff', '#ffa500', '#ffffff'], 'complementary'),
+        (['red', 'cyan'], 'complementary'),
+        (['#ff0000', '#ff2000', '#00ffff', '#00e0ff'], 'complementary'),
+        (['#ff0000', '#00ff00', '#0000ff'], 'triadic'),
+        (['#ff8000', '#00ff80', '#8000ff'], 'triadic'),
+        (['#ff0000', '#80ff00'], 'complex'),
+        (['#ff0000', '#00ff00', '#0000ff', '#ffff00'], 'complex'),
+    ]
+
+    # (hues in degrees, expected harmony)
+    HUES = [
+        ([], 'monochromatic'),
+        ([200, 215], 'monochromatic'),
+        ([350, 10], 'monochromatic'),
+        ([0, 30, 60, 90], 'analogous'),
+        ([0, 45], 'analogous'),
+        ([0, 120], 'complex'),
+        ([10, 190], 'complementary'),
+        ([0, 10, 175, 185], 'complementary'),
+        ([0, 120, 240], 'triadic'),
+        ([30, 150, 270, 280], 'triadic'),
+        ([0, 90, 180, 270], 'complex'),
+    ]
+
+    def test_known_palettes(self):
+        analyzer = WebsiteAnalyzer()
+        for colors, expected in self.PALETTES:
+            with self.subTest(colors=colors):
+                self.assertEqual(analyzer._analyze_color_palette_advanced(colors)['color_harmony'], expected)
+
+    def test_hue_clusters(self):
+        analyzer = WebsiteAnalyzer()
+        for hues, expected in self.HUES:
+            with self.subTest(hues=hues):
+                self.assertEqual(analyzer._detect_color_harmony(hues), expected)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,133 @@
+"""
+Tests for the bounded session cache.
+"""
+import unittest
+from unittest import mock
+
+from src.services.session_cache import SessionCache
+
+
+class FakeClock:
+    """Stand-in for the time module with a manually advanced monotonic clock."""
+
+    def __init__(self):
+        self.now = 1000.0
+
+    def monotonic(self):
+        return self.now
+
+
+class SessionCacheTest(unittest.TestCase):
+    def setUp(self):
+        self.clock = FakeClock()
+        patcher = mock.patch('src.services.session_cache.time', self.clock)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_full_cache_evicts_least_recently_used(self):
+        cache = SessionCache(max_entries=3, ttl=60)
+        for key in ('a', 'b', 'c'):
+            cache.put(key, key)
+        cache.get('a')
+
+        cache.put('d', 'd')
+
+        self.assertIsNone(cache.get('b'))
+        self.assertEqual([cache.get(key) for key in ('a', 'c', 'd')], ['a', 'c', 'd'])
+        self.assertEqual(len(cache), 3)
+
+    def test_eviction_window_keeps_costly_entries(self):
+        # 20 entries give a two-entry eviction window at the LRU end: '0' and '1'
+        cache = SessionCache(max_entries=20, ttl=60)
+        cache.put('0', 0, cost=100.0)
+        for i in range(1, 20):
+            cache.put(str(i), i, cost=1.0)
+
+        cache.put('new', 'new')
+
+        self.assertEqual(cache.get('0'), 0)
+        self.assertIsNone(cache.get('1'))
+
+    def test_expired_entry_is_evicted_before_costly_ones(self):
+        cache = SessionCache(max_entries=2, ttl=60)
+        cache.put('old', 'old', cost=100.0)
+        self.clock.now += 61
+        cache.put('fresh', 'fresh', cost=100.0)
+
+        cache.put('new', 'new')
+
+        self.assertNotIn('old', cache.map)
+        self.assertEqual(sorted(cache.map), ['fresh', 'new'])
+
+    def test_get_expires_entries_after_ttl(self):
+        cache = SessionCache(max_entries=4, ttl=60)
+        cache.put('a', 'a')
+
+        self.clock.now += 60
+        self.assertEqual(cache.get('a'), 'a')
+        self.clock.now += 61
+        self.assertIsNone(cache.get('a'))
+        self.assertEqual(len(cache), 0)
+
+    def test_replace_keeps_position_age_and_cost(self):
+        cache = SessionCache(max_entries=2, ttl=60)
+        cache.put('a', 'a1', cost=5.0)
+        cache.put('b', 'b')
+        self.clock.now += 30
+
+        self.assertTrue(cache.replace('a', 'a2'))
+
+        node = cache.map['a']
+        self.assertEqual((node.value, node.cost, node.hits, node.ts), ('a2', 5.0, 0, 1000.0))
+        # 'a' is still the least recently used entry, so it goes first
+        cache.put('c', 'c')
+        self.assertNotIn('a', cache.map)
+
+    def test_replace_refuses_missing_and_expired_entries(self):
+        cache = SessionCache(max_entries=2, ttl=60)
+        self.assertFalse(cache.replace('missing', 'x'))
+        cache.put('a', 'a')
+        self.clock.now += 61
+        self.assertFalse(cache.replace('a', 'x'))
+
+    def test_url_index_entry_dropped_with_evicted_session(self):
+        cache = SessionCache(max_entries=2, ttl=60)
+        cache.put('a', 'a')
+        cache.index_url('url', 'a')
+        cache.put('b', 'b')
+
+        cache.put('c', 'c')
+
+        self.assertNotIn('a', cache.map)
+        self.assertIsNone(cache.lookup_url('url'))
+        self.assertEqual(cache.url_index, {})
+
+    def test_url_index_entry_dropped_with_expired_session(self):
+        cache = SessionCache(max_entries=2, ttl=60)
+        cache.put('a', 'a')
+        cache.index_url('url', 'a')
+        self.clock.now += 61
+
+        self.assertIsNone(cache.get('a'))
+        self.assertIsNone(cache.lookup_url('url'))
+
+    def test_repointed_url_survives_eviction_of_previous_session(self):
+        cache = SessionCache(max_entries=2, ttl=60)
+        cache.put('a', 'a')
+        cache.index_url('url', 'a')
+        cache.put('b', 'b')
+        cache.index_url('url', 'b')
+
+        cache.put('c', 'c')
+
+        self.assertNotIn('a', cache.map)
+        self.assertEqual(cache.lookup_url('url'), 'b')
+
+    def test_index_url_ignores_unknown_session(self):
+        cache = SessionCache(max_entries=2, ttl=60)
+        cache.index_url('url', 'missing')
+        self.assertIsNone(cache.lookup_url('url'))
+
+
+if __name__ == '__main__':
+    unittest.main()